@@ -17,6 +17,9 @@ class GameConfig:
     FPS: int = 60
     FIXED_DT: float = 1 / FPS
 
+    # How long the menus sleep waiting for an event, in milliseconds.
+    IDLE_TIMEOUT: int = 100
+
 
 @dataclass(frozen=True)
 class InputConfig:
@@ -59,6 +62,9 @@ class TrackConfig:
 
     CHECKPOINT_COLOUR: tuple[int, int, int] = (255, 255, 0)
 
+    # Cells of the checkpoint lookup grid are 2^CHECKPOINT_CELL_SHIFT pixels wide.
+    CHECKPOINT_CELL_SHIFT: int = 4
+
 
 GAME: GameConfig = GameConfig()
 INPUT: InputConfig = InputConfig()
@@ -27,6 +27,9 @@ class ColoursConfig:
     TEXT_SELECTED: ClassVar[Color] = Color(150, 255, 150)
 
     CAR_DEFAULT: ClassVar[Color] = Color(255, 255, 255)
+    CAR_BEST: ClassVar[Color] = Color(0, 255, 0)
+    CAR_WORST: ClassVar[Color] = Color(255, 0, 0)
+    SENSOR: ClassVar[Color] = Color('#9ee88b')
     CARS: ClassVar[list[Color]] = [
         Color('#e85651'),
         Color('#e8bb51'),
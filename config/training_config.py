@@ -1,3 +1,5 @@
+import os
+
 from dataclasses import dataclass
 from typing import ClassVar
 
@@ -23,9 +25,14 @@ class TrainingConfig:
     POPULATION_SIZE: int = 50
     MAX_GENERATION_TIME: float = 30.0
     SPEED: int = 20
+    CONSOLE_FPS: int = 10
+    WORKERS: int = os.cpu_count() or 1
+    PARALLEL_STEP_SIZE: int = 1000
     INTERVAL: int = 4
     SAVE_AMOUNT: int = 10
     AUTOSAVE_INTERVAL: int = 25
+    FITNESS_CACHE_SIZE: int = 1000
+    MAX_HISTORY: int = 10000
 
 
 @dataclass(frozen=True)
@@ -1,9 +1,8 @@
-﻿import pygame
-
-from config import TRAINING
+﻿from config import TRAINING
 from src.training import TrainingLoop
 from src.io import GenomeIO
 from src.game import GameLoop
+from src.core.utils import quit_pygame
 from src.ui import MainMenu, TrackSelector, GenomeSelector
 
 
@@ -77,7 +76,7 @@ def main():
             if result == 'QUIT':
                 break
 
-    pygame.quit()
+    quit_pygame()
 
 
 if __name__ == "__main__":
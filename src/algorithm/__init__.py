@@ -1,4 +1,4 @@
-from .neural_network import NeuralNetwork
+from .neural_network import NeuralNetwork, PopulationNetwork
 from .genome import Genome
 from .genetic_algorithm import GeneticAlgorithm
 from .activation_function import ActivationFunction, Sigmoid, ReLU, Tanh
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Sequence
 from config import GENETIC, RNG
 from .genome import Genome
 
@@ -19,7 +19,7 @@ class GeneticAlgorithm:
     -------
     get_top(num: int) -> list[Genome]
         Returns the top genomes in the population.
-    next_generation(fitness_func: Callable[[Genome], float]) -> None
+    next_generation(fitnesses: Sequence[float]) -> None
         Creates the next generation of genomes.
     """
 
@@ -56,15 +56,15 @@ class GeneticAlgorithm:
         self.population.sort(key=lambda x: x[1], reverse=True)
         return [genome for genome, _ in self.population[:num]]
 
-    def next_generation(self, fitness_func: Callable[[Genome], float]) -> None:
+    def next_generation(self, fitnesses: Sequence[float]) -> None:
 
         """
         Creates the next generation of genomes.
 
         Parameters
         ----------
-        fitness_func : Callable[[Genome], float]
-            The fitness function used to evaluate the population.
+        fitnesses : Sequence[float]
+            The fitness of each genome, in population order.
 
         Notes
         -----
@@ -72,7 +72,7 @@ class GeneticAlgorithm:
         The remaining genomes have a chance to be mutated.
         """
 
-        self._evaluate_fitness(fitness_func)
+        self._evaluate_fitness(fitnesses)
 
         survivors: list[Genome] = self._select_survivors()
 
@@ -105,22 +105,18 @@ class GeneticAlgorithm:
         self.generation += 1
         self.population = new_population
 
-    def _evaluate_fitness(self, fitness_func: Callable[[Genome], float]) -> None:
+    def _evaluate_fitness(self, fitnesses: Sequence[float]) -> None:
 
         """
-        Evaluates the fitness of the population based on a fitness function.
+        Attributes a fitness score to each genome of the population.
 
         Parameters
         ----------
-        fitness_func : Callable[[Genome], float]
-            The fitness function used to evaluate the population.
-
-        Notes
-        -----
-        After evaluation, a fitness score is attributed to each genome.
+        fitnesses : Sequence[float]
+            The fitness of each genome, in population order.
         """
 
-        self.population = [(genome, fitness_func(genome)) for genome, _ in self.population]
+        self.population = [(genome, fitness) for (genome, _), fitness in zip(self.population, fitnesses, strict=True)]
 
     def _select_survivors(self) -> list[Genome]:
 
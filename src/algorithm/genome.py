@@ -1,5 +1,6 @@
 ﻿from __future__ import annotations
 
+import hashlib
 import numpy as np
 
 from enum import Enum
@@ -36,6 +37,8 @@ class Genome:
         Applies mutations to weights, activations, and/or topology.
     copy() -> Genome
         Creates a copy of the genome.
+    checksum() -> str
+        Computes a digest identifying the genome's network.
     """
 
     def __init__(
@@ -406,6 +409,30 @@ class Genome:
 
         return Genome(self.input_size, self.output_size, topology, activations, weights)
 
+    def checksum(self) -> str:
+
+        """
+        Computes a digest identifying the genome's network.
+        Genomes with the same sizes, topology, activation functions, and
+        weights have the same checksum.
+
+        Returns
+        -------
+        str
+            A hexadecimal digest of the genome.
+        """
+
+        digest = hashlib.blake2b(digest_size=16)
+
+        # Hashes the network's shape, followed by its raw weights.
+        shape: list[object] = [self.input_size, self.output_size, *self.topology]
+        shape.extend(type(act).__name__ for act in self.activations)
+
+        digest.update(repr(shape).encode())
+        digest.update(np.ascontiguousarray(self.weights).tobytes())
+
+        return digest.hexdigest()
+
 
 class TopologyMutation(Enum):
 
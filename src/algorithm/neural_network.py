@@ -1,5 +1,7 @@
 ﻿from __future__ import annotations
 
+import numpy as np
+
 from numpy.typing import NDArray
 from .activation_function import ActivationFunction
 from .genome import Genome
@@ -87,6 +89,122 @@ class NeuralNetwork:
         return x
 
 
+class PopulationNetwork:
+
+    """
+    Represents the neural networks of a whole population, run as a batch.
+    Genomes with the same topology and activation functions are grouped so
+    each group's layers run as a single stacked matrix multiplication.
+
+    Methods
+    -------
+    from_genomes(genomes: list[Genome]) -> PopulationNetwork (static)
+        Creates the batched neural networks of a population of genomes.
+    forward(X: NDArray[float], mask: NDArray[bool] | None = None) -> NDArray[float]
+        Executes a full forward pass of every network at once.
+    """
+
+    def __init__(self, groups: list[tuple[NDArray[int], list[StackedLayer]]], size: int, output_size: int) -> None:
+
+        self._groups: list[tuple[NDArray[int], list[StackedLayer]]] = groups
+        self._size: int = size
+        self._output_size: int = output_size
+
+        # Reuses the same output array for every forward pass.
+        self._outputs: NDArray[float] = np.empty((size, output_size))
+
+    @staticmethod
+    def from_genomes(genomes: list[Genome]) -> PopulationNetwork:
+
+        """
+        Creates the batched neural networks of a population of genomes.
+
+        Parameters
+        ----------
+        genomes : list[Genome]
+            The genomes to create the neural networks from.
+
+        Returns
+        -------
+        PopulationNetwork
+            The neural networks created from the genomes.
+        """
+
+        # Groups genomes by network shape.
+        shapes: dict[tuple, list[int]] = {}
+
+        for i, genome in enumerate(genomes):
+
+            key: tuple = (tuple(genome.topology), tuple(type(act) for act in genome.activations))
+            shapes.setdefault(key, []).append(i)
+
+        groups: list[tuple[NDArray[int], list[StackedLayer]]] = []
+
+        for indices in shapes.values():
+
+            # Stacks each layer's weights and biases across the group.
+            group_weights: list[list[tuple[NDArray[float], NDArray[float]]]] = [
+                genomes[i].get_layer_weights() for i in indices
+            ]
+
+            layers: list[StackedLayer] = [
+                StackedLayer(
+                    act,
+                    W=np.stack([weights[layer][0] for weights in group_weights]),
+                    b=np.stack([weights[layer][1] for weights in group_weights])
+                )
+                for layer, act in enumerate(genomes[indices[0]].activations)
+            ]
+
+            groups.append((np.array(indices), layers))
+
+        output_size: int = genomes[0].output_size if genomes else 0
+
+        return PopulationNetwork(groups, len(genomes), output_size)
+
+    def forward(self, X: NDArray[float], mask: NDArray[bool] | None = None) -> NDArray[float]:
+
+        """
+        Executes a full forward pass of every network at once.
+
+        Parameters
+        ----------
+        X : NDArray[float]
+            The input data of each network, with one row per genome.
+        mask : NDArray[bool] | None, optional
+            Which networks are needed. Runs every network if not given.
+
+        Returns
+        -------
+        NDArray[float]
+            The output data of each network, with one row per genome.
+
+        Notes
+        -----
+        Groups without any needed network are skipped, and their rows
+        are left uninitialised. Groups are otherwise run whole, as
+        gathering the needed rows costs more than running the others.
+        The returned array is overwritten by the next forward pass.
+        """
+
+        outputs: NDArray[float] = self._outputs
+
+        # Runs the forward pass of each group.
+        for indices, layers in self._groups:
+
+            if mask is not None and not mask[indices].any():
+                continue
+
+            x: NDArray[float] = X[indices]
+
+            for layer in layers:
+                x = layer.forward(x)
+
+            outputs[indices] = x
+
+        return outputs
+
+
 class DenseLayer:
 
     """
@@ -132,3 +250,43 @@ class DenseLayer:
 
         # Runs the data through the layer's activation function.
         return self._activation.forward(z)
+
+
+class StackedLayer:
+
+    """
+    Represents a stack of dense layers with the same shape, one per network.
+
+    Methods
+    -------
+    forward(x: NDArray[float]) -> NDArray[float]
+        Executes a forward pass of every layer in the stack.
+    """
+
+    def __init__(self, activation: ActivationFunction, W: NDArray[float], b: NDArray[float]):
+
+        self._activation: ActivationFunction = activation
+        self._W: NDArray[float] = W
+        self._b: NDArray[float] = b
+
+    def forward(self, x: NDArray[float]) -> NDArray[float]:
+
+        """
+        Executes a forward pass of every layer in the stack.
+
+        Parameters
+        ----------
+        x : NDArray[float]
+            An array containing the data received by each layer, one row per layer.
+
+        Returns
+        -------
+        NDArray[float]
+            An array containing the output data of each layer, one row per layer.
+        """
+
+        # Multiplies each network's weight matrix by its own input row.
+        z = np.einsum('boi,bi->bo', self._W, x) + self._b
+
+        # Runs the data through the layers' shared activation function.
+        return self._activation.forward(z)
@@ -12,6 +12,12 @@ from .events import Events
 from .track import Track
 
 
+# The scaled, unrotated points of each part of a car's shape.
+_SCALED_SHAPE: dict[str, list[Vector2]] = {
+    part: [Vector2(x * CAR.SIZE, y * CAR.SIZE) for x, y in points] for part, points in CAR.SHAPE.items()
+}
+
+
 class Car:
 
     """
@@ -98,7 +104,7 @@ class Car:
         """
 
         # Stores the previous position and velocity for collision handling.
-        self._previous_position = self.position.copy()
+        self._previous_position.update(self.position)
         self._previous_velocity = self.velocity
 
         # Accelerates.
@@ -117,7 +123,7 @@ class Car:
         self.velocity *= CAR.FRICTION ** (dt * 60)
 
         # Changes the car's position based on direction and velocity.
-        self._direction = Vector2(np.cos(self.angle), np.sin(self.angle))
+        self._direction.update(np.cos(self.angle), np.sin(self.angle))
         self.position += self._direction * self.velocity * dt
 
         # Updates the car rect.
@@ -318,10 +324,7 @@ class Car:
         Its shape is controlled by ``CarConfig.SHAPE``.
         """
 
-        return [
-            self.position + Vector2(x * CAR.SIZE, y * CAR.SIZE).rotate_rad(self.angle)
-            for x, y in CAR.SHAPE[part]
-        ]
+        return [self.position + point.rotate_rad(self.angle) for point in _SCALED_SHAPE[part]]
 
     def _add_listeners(self) -> None:
 
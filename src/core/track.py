@@ -34,6 +34,21 @@ class Track:
         The starting position for the player car.
     shape : Polygon
         The track's valid racing area.
+    collision_mask : NDArray[np.uint8]
+        A 2D array where 1 indicates valid track area, 0 indicates off-track.
+    checkpoint_bounds : NDArray[float]
+        The bounding box of each checkpoint.
+    checkpoint_orders : NDArray[int]
+        The order of each checkpoint.
+    checkpoint_vertices : NDArray[float]
+        The padded exterior ring of each checkpoint.
+    checkpoint_vertex_counts : NDArray[int]
+        The number of valid vertices in each checkpoint's ring.
+    checkpoint_grid : NDArray[np.int16]
+        The checkpoint whose bounding box covers each grid cell, -1 if none,
+        or -2 if several do.
+    finish_bounds : NDArray[int]
+        The finish line rectangle as left, top, width and height.
 
     Methods
     -------
@@ -43,6 +58,8 @@ class Track:
         Raycast using the collision mask.
     check_checkpoint(x: float, y: float) -> int
         Checks if a position is inside any checkpoint.
+    check_checkpoints(positions: NDArray[float]) -> NDArray[int]
+        Checks which checkpoint each of many positions is inside.
     draw(screen: Surface) -> None
         Draws the track on the screen.
     """
@@ -56,6 +73,9 @@ class Track:
         self._show_checkpoints: bool = False
         self.background: Surface = self._load_background()
 
+        # Caches the background composited with the checkpoints, rendered on first draw.
+        self._rendered: Surface | None = None
+
         self.checkpoints: list[Checkpoint] = self._load_checkpoints()
         self.checkpoints.sort(key=lambda cp: cp.order)
 
@@ -67,7 +87,7 @@ class Track:
         self._load_start_positions()
 
         # Pre-computes the collision mask.
-        self._collision_mask: NDArray[np.uint8] = self._create_collision_mask()
+        self.collision_mask: NDArray[np.uint8] = self._create_collision_mask()
 
         # Pre-computes checkpoint bounding boxes.
         self._checkpoint_bounds: list[tuple[int, int, int, int]] = [
@@ -80,6 +100,13 @@ class Track:
             for cp in self.checkpoints
         ]
 
+        # Pre-computes checkpoint and finish line arrays for compiled kernels.
+        self.checkpoint_bounds: NDArray[np.float64] = np.array(self._checkpoint_bounds, dtype=np.float64).reshape(-1, 4)
+        self.checkpoint_orders: NDArray[np.int64] = np.array([cp.order for cp in self.checkpoints], dtype=np.int64)
+        self.checkpoint_vertices, self.checkpoint_vertex_counts = self._create_checkpoint_vertices()
+        self.checkpoint_grid: NDArray[np.int16] = self._create_checkpoint_grid()
+        self.finish_bounds: NDArray[np.int64] = np.array(self.finish_line, dtype=np.int64)
+
         self._add_listeners()
 
     def _load_background(self) -> Surface:
@@ -236,6 +263,62 @@ class Track:
 
         return mask
 
+    def _create_checkpoint_vertices(self) -> tuple[NDArray[np.float64], NDArray[np.int64]]:
+
+        """
+        Packs the checkpoints' exterior rings into a single padded array.
+
+        Returns
+        -------
+        tuple[NDArray[float], NDArray[int]]
+            The closed exterior ring of each checkpoint with shape ``(C, V, 2)``,
+            and the number of valid vertices in each ring.
+        """
+
+        rings: list[NDArray[np.float64]] = [np.asarray(cp.shape.exterior.coords) for cp in self.checkpoints]
+        counts: NDArray[np.int64] = np.array([len(ring) for ring in rings], dtype=np.int64)
+
+        vertices: NDArray[np.float64] = np.zeros((len(rings), max(counts, default=0), 2))
+
+        for i, ring in enumerate(rings):
+            vertices[i, :len(ring)] = ring
+
+        return vertices, counts
+
+    def _create_checkpoint_grid(self) -> NDArray[np.int16]:
+
+        """
+        Rasterises the checkpoints' bounding boxes into a coarse lookup grid.
+
+        Returns
+        -------
+        NDArray[np.int16]
+            The index of the only checkpoint whose bounding box covers each
+            cell, -1 if none does, or -2 if several do.
+
+        Notes
+        -----
+        Cells are ``2 ** TRACK.CHECKPOINT_CELL_SHIFT`` pixels wide, so a
+        position is looked up with ``grid[y >> shift, x >> shift]``.
+        """
+
+        shift: int = TRACK.CHECKPOINT_CELL_SHIFT
+        height, width = self.collision_mask.shape
+        grid: NDArray[np.int16] = np.full((-(-height >> shift), -(-width >> shift)), -1, dtype=np.int16)
+
+        for i, (min_x, min_y, max_x, max_y) in enumerate(self._checkpoint_bounds):
+
+            # Clamps the bounding box to the grid.
+            cells: tuple[slice, slice] = (
+                slice(max(min_y, 0) >> shift, (max(max_y, -1) >> shift) + 1),
+                slice(max(min_x, 0) >> shift, (max(max_x, -1) >> shift) + 1)
+            )
+
+            # Marks cells already covered by another checkpoint as ambiguous.
+            grid[cells] = np.where(grid[cells] == -1, i, -2)
+
+        return grid
+
     def _add_listeners(self) -> None:
 
         """
@@ -271,7 +354,7 @@ class Track:
         if x < 0 or x >= self._width or y < 0 or y >= self._height:
             return False
 
-        return self._collision_mask[y, x] == 1
+        return self.collision_mask[y, x] == 1
 
     def raycast(self, origin: Vector2, direction: Vector2, max_distance: float) -> float:
 
@@ -321,7 +404,7 @@ class Track:
                 return distance
 
             # Collision check.
-            if self._collision_mask[iy, ix] == 0:
+            if self.collision_mask[iy, ix] == 0:
                 return distance
 
             # Advances along ray.
@@ -349,7 +432,9 @@ class Track:
             The checkpoint order if inside one, -1 otherwise.
         """
 
-        for i, (min_x, min_y, max_x, max_y) in enumerate(self._checkpoint_bounds):
+        for i in self._checkpoint_candidates(x, y):
+
+            min_x, min_y, max_x, max_y = self._checkpoint_bounds[i]
 
             # Fast bounding box rejection.
             if x < min_x or x > max_x or y < min_y or y > max_y:
@@ -361,6 +446,82 @@ class Track:
 
         return -1
 
+    def _checkpoint_candidates(self, x: float, y: float) -> range:
+
+        """
+        Looks up which checkpoints a position could be inside.
+
+        Parameters
+        ----------
+        x : float
+            The x-coordinate to check.
+        y : float
+            The y-coordinate to check.
+
+        Returns
+        -------
+        range
+            The indices of the checkpoints whose bounding box may contain the position.
+        """
+
+        shift: int = TRACK.CHECKPOINT_CELL_SHIFT
+        height, width = self.checkpoint_grid.shape
+        row: int = int(y) >> shift
+        column: int = int(x) >> shift
+
+        # Falls back to every checkpoint outside the grid.
+        if x < 0 or y < 0 or row >= height or column >= width:
+            return range(len(self.checkpoints))
+
+        candidate: int = int(self.checkpoint_grid[row, column])
+
+        if candidate == -1:
+            return range(0)
+
+        if candidate == -2:
+            return range(len(self.checkpoints))
+
+        return range(candidate, candidate + 1)
+
+    def check_checkpoints(self, positions: NDArray[np.float64]) -> NDArray[np.int64]:
+
+        """
+        Checks which checkpoint each of many positions is inside.
+
+        Parameters
+        ----------
+        positions : NDArray[float]
+            The positions to check, with shape ``(N, 2)``.
+
+        Returns
+        -------
+        NDArray[int]
+            The checkpoint order each position is inside, or -1 if none.
+
+        Notes
+        -----
+        Matches calling ``check_checkpoint()`` on each position, but
+        tests every position against every bounding box at once.
+        """
+
+        x: NDArray[np.float64] = positions[:, 0:1]
+        y: NDArray[np.float64] = positions[:, 1:2]
+        bounds: NDArray[np.float64] = self.checkpoint_bounds
+
+        # Fast bounding box rejection, for every position and checkpoint at once.
+        candidates: NDArray[np.bool_] = (
+            (x >= bounds[:, 0]) & (x <= bounds[:, 2]) & (y >= bounds[:, 1]) & (y <= bounds[:, 3])
+        )
+
+        orders: NDArray[np.int64] = np.full(len(positions), -1, dtype=np.int64)
+
+        # Full containment check only for candidates, in checkpoint order.
+        for i, c in zip(*np.nonzero(candidates)):
+            if orders[i] < 0 and self.checkpoints[c].shape.contains(Point(positions[i, 0], positions[i, 1])):
+                orders[i] = self.checkpoints[c].order
+
+        return orders
+
     def draw(self, screen: Surface) -> None:
 
         """
@@ -374,15 +535,33 @@ class Track:
         Notes
         -----
         Draws the background and checkpoints if visibility is toggled on.
+        Both are rendered once into a cached surface, which is re-rendered
+        only when checkpoint visibility changes.
+        """
+
+        if self._rendered is None:
+            self._rendered = self._render()
+
+        screen.blit(self._rendered, (0, 0))
+
+    def _render(self) -> Surface:
+
+        """
+        Renders the background and, if visible, the checkpoints.
+
+        Returns
+        -------
+        Surface
+            A surface with the fully rendered track.
         """
 
-        screen.blit(self.background, (0, 0))
+        surface: Surface = self.background.copy()
 
-        if not self._show_checkpoints:
-            return
+        if self._show_checkpoints:
+            for checkpoint in self.checkpoints:
+                checkpoint.draw(surface)
 
-        for checkpoint in self.checkpoints:
-            checkpoint.draw(screen)
+        return surface
 
     def _toggle_checkpoints(self) -> None:
 
@@ -391,6 +570,7 @@ class Track:
         """
 
         self._show_checkpoints = not self._show_checkpoints
+        self._rendered = None
 
 
 class Checkpoint:
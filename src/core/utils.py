@@ -1,9 +1,198 @@
+import pygame
+
+from functools import cache, lru_cache
+from typing import Callable, TypeVar
 from pygame import Color, Surface, Rect
 from pygame.font import Font
 from pytmx import TiledElement, TiledMap
 from config import COLOURS, FONTS
 
 
+# The system cursor last set, so setting it again can be skipped.
+_cursor: int = pygame.SYSTEM_CURSOR_ARROW
+
+# Cached functions whose results belong to Pygame, cleared when it shuts down.
+_pygame_caches: list[Callable] = []
+
+_Cached = TypeVar('_Cached', bound=Callable)
+
+
+def clear_on_quit(cached: _Cached) -> _Cached:
+
+    """
+    Registers a cached function whose results belong to Pygame, so its cache
+    is cleared by ``quit_pygame()``.
+
+    Parameters
+    ----------
+    cached : Callable
+        A function wrapped with ``functools.cache`` or ``functools.lru_cache``.
+
+    Returns
+    -------
+    Callable
+        The same function, so this can be used as a decorator.
+    """
+
+    _pygame_caches.append(cached)
+
+    return cached
+
+
+@clear_on_quit
+@cache
+def get_font(font_size: int) -> Font:
+
+    """
+    Gets the default font at a given size.
+
+    Parameters
+    ----------
+    font_size : int
+        Font size to use.
+
+    Returns
+    -------
+    Font
+        The default font, loaded only once per size.
+    """
+
+    return Font(FONTS.PATH, font_size)
+
+
+def init_pygame() -> None:
+
+    """
+    Starts Pygame if it isn't running, and loads the fonts the screens use.
+
+    Notes
+    -----
+    Every screen calls this when it is created, but Pygame is only started
+    again after the game or training loop has shut it down. The fonts are
+    loaded here rather than on the first draw, so drawing text only looks
+    them up.
+    """
+
+    if not pygame.get_init():
+        pygame.init()
+
+    for font_size in (FONTS.SIZE_NORMAL, FONTS.SIZE_LARGE, FONTS.SIZE_XL):
+        get_font(font_size)
+
+
+def quit_pygame() -> None:
+
+    """
+    Shuts Pygame down, along with everything cached that belongs to it.
+
+    Notes
+    -----
+    Fonts are freed by ``pygame.quit()``, but the menus start Pygame again
+    afterwards, so the cached ones must not be used again. Cached surfaces
+    are dropped with them, as they were converted for the display being
+    closed. The cursor goes back to the default arrow when Pygame starts
+    again, so the one last set is forgotten too.
+    """
+
+    global _cursor
+
+    for cached in _pygame_caches:
+        cached.cache_clear()
+
+    _cursor = pygame.SYSTEM_CURSOR_ARROW
+    pygame.quit()
+
+
+def render_outlined_text(
+        text: str,
+        text_colour: Color = COLOURS.TEXT_MAIN,
+        outline_colour: Color = COLOURS.BACKGROUND,
+        outline_thickness: int = 2,
+        font_size: int = FONTS.SIZE_NORMAL
+) -> Surface:
+
+    """
+    Renders text with an outline onto a new surface.
+
+    Parameters
+    ----------
+    text : str
+        The text to render.
+    text_colour : Color, optional
+        The main text color (defaults to white).
+    outline_colour : Color, optional
+        The outline color (defaults to black).
+    outline_thickness : int, optional
+        Thickness of the outline in pixels (defaults to 2).
+    font_size : int, optional
+        Font size to use.
+
+    Returns
+    -------
+    Surface
+        A transparent surface with the outlined text. The text is padded
+        by ``outline_thickness`` on every side to fit the outline.
+    """
+
+    font: Font = get_font(font_size)
+
+    # Renders the surfaces.
+    outline_surf: Surface = font.render(text, True, outline_colour)
+    text_surf: Surface = font.render(text, True, text_colour)
+
+    # Matches the display's pixel format, so the text is blitted without converting it each time.
+    surface: Surface = Surface(
+        (text_surf.get_width() + 2 * outline_thickness, text_surf.get_height() + 2 * outline_thickness),
+        pygame.SRCALPHA
+    ).convert_alpha()
+
+    # Draws the outline in 8 directions.
+    for dx in [0, outline_thickness, 2 * outline_thickness]:
+        for dy in [0, outline_thickness, 2 * outline_thickness]:
+            if dx != outline_thickness or dy != outline_thickness:
+                surface.blit(outline_surf, (dx, dy))
+
+    # Draws the main text.
+    surface.blit(text_surf, (outline_thickness, outline_thickness))
+
+    return surface
+
+
+@clear_on_quit
+@lru_cache(maxsize=256)
+def _render_cached_text(
+        text: str,
+        text_colour: tuple[int, int, int, int],
+        outline_colour: tuple[int, int, int, int],
+        outline_thickness: int,
+        font_size: int
+) -> Surface:
+
+    """
+    Renders text with an outline, reusing the surface while it is in the cache.
+
+    Parameters
+    ----------
+    text : str
+        The text to render.
+    text_colour : tuple[int, int, int, int]
+        The main text colour, as a tuple so it can be cached.
+    outline_colour : tuple[int, int, int, int]
+        The outline colour, as a tuple so it can be cached.
+    outline_thickness : int
+        Thickness of the outline in pixels.
+    font_size : int
+        Font size to use.
+
+    Returns
+    -------
+    Surface
+        The outlined text, shared with every other caller drawing the same text.
+    """
+
+    return render_outlined_text(text, Color(text_colour), Color(outline_colour), outline_thickness, font_size)
+
+
 def draw_outlined_text(
         screen: Surface,
         text: str,
@@ -13,7 +202,7 @@ def draw_outlined_text(
         outline_thickness: int = 2,
         font_size: int = FONTS.SIZE_NORMAL,
         align: str = "centre"
-) -> None:
+) -> Rect:
 
     """
     Draws text with an outline at a given position.
@@ -36,29 +225,86 @@ def draw_outlined_text(
         Font size to use.
     align : str, optional
         The alignment of the text.
+
+    Returns
+    -------
+    Rect
+        The area of the surface the text was drawn over.
+
+    Notes
+    -----
+    Text drawn with this function is mostly constant, such as titles and
+    labels, so it is only rendered the first time it is drawn.
     """
 
-    # Default font.
-    font: Font = Font(FONTS.PATH, font_size)
+    surface: Surface = _render_cached_text(
+        text, tuple(text_colour), tuple(outline_colour), outline_thickness, font_size
+    )
 
-    # Renders the surfaces.
-    outline_surf: Surface = font.render(text, True, outline_colour)
-    text_surf: Surface = font.render(text, True, text_colour)
+    # The outline pads the text equally on every side, so only left alignment needs an offset.
+    if align == "left":
+        rect: Rect = surface.get_rect(topleft=(pos[0] - outline_thickness, pos[1] - outline_thickness))
+    else:
+        rect = surface.get_rect(center=pos)
 
-    # Defines a get_rect function based on alignment.
-    def get_rect(surf: Surface, position: tuple[int, int]) -> Rect:
-        if align == "left":
-            return surf.get_rect(topleft=position)
-        return surf.get_rect(center=position)
+    return screen.blit(surface, rect)
 
-    # Draws the outline in 8 directions.
-    for dx in [-outline_thickness, 0, outline_thickness]:
-        for dy in [-outline_thickness, 0, outline_thickness]:
-            if dx != 0 or dy != 0:
-                screen.blit(outline_surf, get_rect(outline_surf, (pos[0] + dx, pos[1] + dy)))
 
-    # Draws the main text.
-    screen.blit(text_surf, get_rect(text_surf, pos))
+def get_pending_events(first: pygame.event.Event) -> list[pygame.event.Event]:
+
+    """
+    Gets every pending Pygame event, merging runs of mouse motion.
+
+    Parameters
+    ----------
+    first : pygame.event.Event
+        An event already taken from the queue, which comes before the
+        pending ones, or a ``NOEVENT`` if there is none.
+
+    Returns
+    -------
+    list[pygame.event.Event]
+        The events in the order they happened, where only the last of any
+        consecutive mouse motion events is kept.
+
+    Notes
+    -----
+    Motion is only dropped when another motion event directly follows it,
+    so clicks are still handled where the mouse was when they happened.
+    """
+
+    events: list[pygame.event.Event] = pygame.event.get()
+
+    if first.type != pygame.NOEVENT:
+        events.insert(0, first)
+
+    return [
+        event for event, following in zip(events, events[1:] + [None])
+        if event.type != pygame.MOUSEMOTION or following is None or following.type != pygame.MOUSEMOTION
+    ]
+
+
+def set_system_cursor(cursor: int) -> None:
+
+    """
+    Sets the mouse cursor, unless it is already showing.
+
+    Parameters
+    ----------
+    cursor : int
+        The system cursor to show, such as ``pygame.SYSTEM_CURSOR_HAND``.
+
+    Notes
+    -----
+    Every cursor change must go through this function, so the cursor it
+    remembers is always the one showing.
+    """
+
+    global _cursor
+
+    if cursor != _cursor:
+        pygame.mouse.set_cursor(cursor)
+        _cursor = cursor
 
 
 def get_tiled_layer(tmx_data: TiledMap, layer_name: str) -> TiledElement | None:
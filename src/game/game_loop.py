@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import pygame
+import numpy as np
 
+from numpy.typing import NDArray
 from pygame import Surface, Vector2
 from pygame.time import Clock
 from config import GAME, COLOURS, FONTS
@@ -9,11 +11,15 @@ from src.algorithm import Genome
 from src.training import AIController
 from src.io import GenomeIO
 from src.core import Car, Events, Track
-from src.core.utils import draw_outlined_text
+from src.core.utils import draw_outlined_text, init_pygame, quit_pygame
 from src.ui import Button
 from .input_handler import InputHandler
 
 
+# The events the game loop responds to.
+_EVENTS: tuple[int, ...] = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN)
+
+
 class GameLoop:
 
     """
@@ -31,7 +37,7 @@ class GameLoop:
 
     def __init__(self, track_path: str, genome_paths: list[str]) -> None:
 
-        pygame.init()
+        init_pygame()
 
         self._screen: Surface = pygame.display.set_mode((GAME.SCREEN_WIDTH, GAME.SCREEN_HEIGHT))
         self._clock: Clock = Clock()
@@ -102,6 +108,11 @@ class GameLoop:
             'QUIT' if window was closed, ``None`` if ESC was pressed.
         """
 
+        # Has SDL drop every event the game ignores, instead of queueing it. Pygame lets them all through again
+        # once it is shut down.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_EVENTS)
+
         while self._running:
 
             result: str | None = self._process_events()
@@ -109,7 +120,7 @@ class GameLoop:
             # If X button was clicked, returns immediately.
             if result == 'QUIT':
 
-                pygame.quit()
+                quit_pygame()
                 return 'QUIT'
 
             # Calculates delta time and adds to the fixed accumulator.
@@ -125,7 +136,7 @@ class GameLoop:
             self._update(dt)
             self._draw()
 
-        pygame.quit()
+        quit_pygame()
         return None
 
     def _process_events(self) -> str | None:
@@ -195,14 +206,14 @@ class GameLoop:
         InputHandler.fixed_update(self._player_car)
 
         # Updates AI cars.
-        for controller in self._ai_controllers:
+        alive: list[AIController] = [controller for controller in self._ai_controllers if controller.is_alive]
 
-            if not controller.is_alive:
-                continue
+        for controller in alive:
 
             controller.fixed_update()
             controller.car.fixed_update(dt)
-            self._handle_ai_collisions(controller)
+
+        self._handle_ai_collisions(alive)
 
     def _handle_player_collisions(self) -> None:
 
@@ -227,33 +238,46 @@ class GameLoop:
         if self._player_car.rect.colliderect(self._track.finish_line):
             self._player_car.handle_finish_line(self._num_checkpoints)
 
-    def _handle_ai_collisions(self, controller: AIController) -> None:
+    def _handle_ai_collisions(self, controllers: list[AIController]) -> None:
 
         """
-        Handles collision and checkpoint detection for an AI controller.
+        Handles collision and checkpoint detection for AI controllers.
 
         Parameters
         ----------
-        controller : AIController
-            The AI controller to check collisions for.
+        controllers : list[AIController]
+            The AI controllers to check collisions for.
+
+        Notes
+        -----
+        Checkpoints are checked for every surviving car at once.
         """
 
-        car = controller.car
+        survivors: list[AIController] = []
 
         # Checks for collisions with the track bounds.
-        if car.check_track_collision(self._track):
-            controller.kill()
+        for controller in controllers:
+
+            if controller.car.check_track_collision(self._track):
+                controller.kill()
+            else:
+                survivors.append(controller)
+
+        if not survivors:
             return
 
         # Checks for checkpoint crossing.
-        checkpoint_order: int = self._track.check_checkpoint(car.position.x, car.position.y)
+        positions: NDArray[np.float64] = np.array([controller.car.position for controller in survivors])
+        checkpoint_orders: NDArray[np.int64] = self._track.check_checkpoints(positions)
 
-        if checkpoint_order >= 0:
-            controller.handle_checkpoint_hit(checkpoint_order, self._num_checkpoints)
+        for controller, checkpoint_order in zip(survivors, checkpoint_orders):
 
-        # Checks for finish line crossing.
-        if car.rect.colliderect(self._track.finish_line):
-            controller.handle_finish_line(self._num_checkpoints)
+            if checkpoint_order >= 0:
+                controller.handle_checkpoint_hit(int(checkpoint_order), self._num_checkpoints)
+
+            # Checks for finish line crossing.
+            if controller.car.rect.colliderect(self._track.finish_line):
+                controller.handle_finish_line(self._num_checkpoints)
 
     def _draw(self) -> None:
 
@@ -1,4 +1,6 @@
+import os
 import pickle
+import numpy as np
 
 from typing import Type, TypedDict
 from pathlib import Path
@@ -17,6 +19,8 @@ class GenomeIO:
         Saves a genome to a file.
     load_genome(filepath: str) -> Genome
         Loads a genome from a file.
+    save_genomes(genomes: list[Genome], generation: int, directory: str) -> None
+        Saves a generation's ranked genomes.
     save_best_genomes(genetic_algorithm: GeneticAlgorithm, num_best: int, directory: str) -> None:
         Saves the best genomes from a genetic algorithm.
     """
@@ -39,17 +43,24 @@ class GenomeIO:
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
 
         # Prepares the data for serialisation.
+        # Weights are stored in single precision, which halves their size.
+        # The genomes in data/genomes, saved this way, still end every track in exactly the same state.
         data: GenomeData = {
             'input_size': genome.input_size,
             'output_size': genome.output_size,
             'topology': genome.topology,
             'activations': [type(act).__name__ for act in genome.activations],
-            'weights': genome.weights
+            'weights': genome.weights.astype(np.float32)
         }
 
-        # Writes the file.
-        with open(filepath, 'wb') as f:
-            pickle.dump(data, f)  # type: ignore (false alarm!)
+        # Writes a temporary file and moves it over the genome, so the genome is never left half-written.
+        # Moving it also changes the directory's modification time, even when an existing genome is overwritten.
+        temporary_path: str = f"{filepath}.tmp"
+
+        with open(temporary_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)  # type: ignore (false alarm!)
+
+        os.replace(temporary_path, filepath)
 
         print(f"Genome saved to: {filepath}")
 
@@ -92,7 +103,7 @@ class GenomeIO:
             output_size=data['output_size'],
             topology=data['topology'],
             activations=activations,
-            weights=data['weights']
+            weights=np.asarray(data['weights'], dtype=np.float64)
         )
 
         print(f"Genome loaded from: {filepath}")
@@ -115,12 +126,29 @@ class GenomeIO:
         """
 
         best_genomes: list[Genome] = genetic_algorithm.get_top(num_best)
+        GenomeIO.save_genomes(best_genomes, genetic_algorithm.generation - 1, directory)
+
+    @staticmethod
+    def save_genomes(genomes: list[Genome], generation: int, directory: str) -> None:
+
+        """
+        Saves a generation's ranked genomes.
+
+        Parameters
+        ----------
+        genomes : list[Genome]
+            The genomes to save, from best to worst.
+        generation : int
+            The generation the genomes belong to.
+        directory : str
+            Directory to save genomes to.
+        """
 
-        for i, genome in enumerate(best_genomes, 1):
-            filepath: str = f"{directory}/genome_gen{genetic_algorithm.generation - 1}_rank{i}.pkl"
+        for i, genome in enumerate(genomes, 1):
+            filepath: str = f"{directory}/genome_gen{generation}_rank{i}.pkl"
             GenomeIO.save_genome(genome, filepath)
 
-        print(f"Saved top {num_best} genomes to {directory}")
+        print(f"Saved top {len(genomes)} genomes to {directory}")
 
 
 class GenomeData(TypedDict):
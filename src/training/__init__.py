@@ -1,2 +1,4 @@
 from .ai_controller import AIController
+from .population_state import PopulationState
+from .simulation import TrackData
 from .training_loop import TrainingLoop
@@ -0,0 +1,533 @@
+import numpy as np
+
+from numba import njit, prange
+from numpy.typing import NDArray
+
+
+# The fast-math optimisations the kernels allow. Leaves out 'nnan' and 'ninf', as the car bounds start at infinity.
+_FASTMATH: set[str] = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _point_in_polygon(x: float, y: float, vertices: NDArray[np.float64], count: int) -> bool:
+
+    """
+    Checks if a point is inside a polygon using the even-odd crossing rule.
+
+    Parameters
+    ----------
+    x : float
+        The x-coordinate to check.
+    y : float
+        The y-coordinate to check.
+    vertices : NDArray[float]
+        The polygon's closed exterior ring, padded to a fixed length.
+    count : int
+        The number of valid vertices in the ring.
+
+    Returns
+    -------
+    bool
+        ``True`` if the point is inside the polygon, ``False`` otherwise.
+    """
+
+    inside: bool = False
+
+    for j in range(count - 1):
+
+        x1, y1 = vertices[j, 0], vertices[j, 1]
+        x2, y2 = vertices[j + 1, 0], vertices[j + 1, 1]
+
+        # Toggles whenever a horizontal ray from the point crosses an edge.
+        if (y1 > y) != (y2 > y) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
+            inside = not inside
+
+    return inside
+
+
+@njit(cache=True)
+def _car_fitness(
+    i: int,
+    velocities: NDArray[np.float64],
+    checkpoint_idx: NDArray[np.int64],
+    laps: NDArray[np.int64],
+    time_alive: NDArray[np.float64],
+    total_distance: NDArray[np.float64],
+    wrong_checkpoints: NDArray[np.int64],
+    sensors: NDArray[np.float64],
+    fitness_weights: NDArray[np.float64]
+) -> float:
+
+    """
+    Calculates the fitness score of a single car.
+
+    Notes
+    -----
+    Mirrors the fitness formula of ``FitnessConfig``, adding the terms in
+    the same order as NumPy would. It is compiled without fast maths so
+    the result does not depend on how it is vectorised.
+    """
+
+    # Averages the sensor distances.
+    safety: float = 0.0
+
+    for s in range(sensors.shape[1]):
+        safety += sensors[i, s]
+
+    safety /= sensors.shape[1]
+
+    return (
+        total_distance[i] * fitness_weights[0] +
+        checkpoint_idx[i] * fitness_weights[1] +
+        wrong_checkpoints[i] * fitness_weights[2] +
+        laps[i] * fitness_weights[3] +
+        safety * fitness_weights[4] +
+        max(velocities[i], 0.0) * fitness_weights[5] +
+        time_alive[i] * fitness_weights[6]
+    )
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _step_car(
+    i: int,
+    positions: NDArray[np.float64],
+    velocities: NDArray[np.float64],
+    angles: NDArray[np.float64],
+    alive: NDArray[np.bool_],
+    fitness: NDArray[np.float64],
+    checkpoint_idx: NDArray[np.int64],
+    laps: NDArray[np.int64],
+    time_alive: NDArray[np.float64],
+    total_distance: NDArray[np.float64],
+    wrong_checkpoints: NDArray[np.int64],
+    sensors: NDArray[np.float64],
+    accelerate: NDArray[np.bool_],
+    brake: NDArray[np.bool_],
+    turn: NDArray[np.int64],
+    acceleration: float,
+    brake_strength: float,
+    turn_speed: float,
+    friction: float,
+    fitness_weights: NDArray[np.float64],
+    car_shape: NDArray[np.float64],
+    track_mask: NDArray[np.uint8],
+    cp_bounds: NDArray[np.float64],
+    cp_vertices: NDArray[np.float64],
+    cp_vertex_counts: NDArray[np.int64],
+    cp_orders: NDArray[np.int64],
+    cp_grid: NDArray[np.int16],
+    cp_shift: int,
+    finish_bounds: NDArray[np.int64],
+    dt: float
+) -> None:
+
+    """
+    Advances a single living car by one physics step.
+
+    Notes
+    -----
+    See ``step_population()`` for the parameters.
+    """
+
+    height: int = track_mask.shape[0]
+    width: int = track_mask.shape[1]
+
+    # Scores the car before it moves.
+    fitness[i] = _car_fitness(
+        i, velocities, checkpoint_idx, laps, time_alive, total_distance, wrong_checkpoints, sensors, fitness_weights
+    )
+
+    # Integrates the car's physics.
+    v: float = velocities[i]
+
+    if accelerate[i]:
+        v += acceleration * dt
+    if brake[i]:
+        v -= brake_strength * dt
+
+    v *= friction
+    angle: float = angles[i] + turn[i] * turn_speed * dt
+    cos: float = np.cos(angle)
+    sin: float = np.sin(angle)
+
+    x: float = positions[i, 0] + cos * v * dt
+    y: float = positions[i, 1] + sin * v * dt
+
+    positions[i, 0] = x
+    positions[i, 1] = y
+    velocities[i] = v
+    angles[i] = angle
+
+    # Checks the triangle's points against the collision mask, tracking its bounds.
+    crashed: bool = False
+    min_x: float = np.inf
+    min_y: float = np.inf
+    max_x: float = -np.inf
+    max_y: float = -np.inf
+
+    for p in range(car_shape.shape[0]):
+
+        px: float = x + car_shape[p, 0] * cos - car_shape[p, 1] * sin
+        py: float = y + car_shape[p, 0] * sin + car_shape[p, 1] * cos
+
+        min_x = min(min_x, px)
+        min_y = min(min_y, py)
+        max_x = max(max_x, px)
+        max_y = max(max_y, py)
+
+        ix: int = int(px)
+        iy: int = int(py)
+
+        if ix < 0 or ix >= width or iy < 0 or iy >= height or track_mask[iy, ix] == 0:
+            crashed = True
+
+    # Kills crashed cars, with a final fitness score.
+    if crashed:
+
+        fitness[i] = _car_fitness(
+            i, velocities, checkpoint_idx, laps, time_alive, total_distance, wrong_checkpoints, sensors,
+            fitness_weights
+        )
+
+        alive[i] = False
+        velocities[i] = 0.0
+        return
+
+    total_checkpoints: int = cp_orders.shape[0]
+
+    # Looks up the only checkpoint the car could be inside, falling back to all of them if unsure.
+    first: int = 0
+    last: int = total_checkpoints
+    row: int = int(y) >> cp_shift
+    column: int = int(x) >> cp_shift
+
+    if x >= 0 and y >= 0 and row < cp_grid.shape[0] and column < cp_grid.shape[1]:
+
+        candidate: int = cp_grid[row, column]
+
+        if candidate == -1:
+            last = 0
+        elif candidate >= 0:
+            first = candidate
+            last = candidate + 1
+
+    # Checks for checkpoint crossing using fast bounding box pre-rejection.
+    for c in range(first, last):
+
+        if x < cp_bounds[c, 0] or x > cp_bounds[c, 2] or y < cp_bounds[c, 1] or y > cp_bounds[c, 3]:
+            continue
+
+        if not _point_in_polygon(x, y, cp_vertices[c], cp_vertex_counts[c]):
+            continue
+
+        order: int = cp_orders[c]
+
+        # Only counts the needed checkpoint.
+        current: int = checkpoint_idx[i]
+
+        if order == current:
+            current += 1
+            checkpoint_idx[i] = current
+
+        # Calculates the circular "distance" to the checkpoint that was expected.
+        expected: int = max(current - 1, 0)
+        forward_dist: int = (order - expected) % total_checkpoints
+        backward_dist: int = (expected - order) % total_checkpoints
+
+        # Penalises hitting checkpoints that are 2+ positions away.
+        if order != current - 1 and min(forward_dist, backward_dist) >= 2:
+            wrong_checkpoints[i] += 1
+
+        break
+
+    # Checks for finish line crossing, truncating the car's rect as Rect does.
+    left: int = int(min_x)
+    top: int = int(min_y)
+    rect_width: int = int(max_x - min_x)
+    rect_height: int = int(max_y - min_y)
+
+    crossed_finish: bool = (
+        rect_width > 0 and rect_height > 0 and
+        left < finish_bounds[0] + finish_bounds[2] and finish_bounds[0] < left + rect_width and
+        top < finish_bounds[1] + finish_bounds[3] and finish_bounds[1] < top + rect_height
+    )
+
+    # Only counts a lap if all checkpoints have been hit.
+    if crossed_finish and checkpoint_idx[i] == total_checkpoints:
+        laps[i] += 1
+        checkpoint_idx[i] = 0
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def step_population(
+    positions: NDArray[np.float64],
+    velocities: NDArray[np.float64],
+    angles: NDArray[np.float64],
+    alive: NDArray[np.bool_],
+    fitness: NDArray[np.float64],
+    checkpoint_idx: NDArray[np.int64],
+    laps: NDArray[np.int64],
+    time_alive: NDArray[np.float64],
+    total_distance: NDArray[np.float64],
+    wrong_checkpoints: NDArray[np.int64],
+    sensors: NDArray[np.float64],
+    accelerate: NDArray[np.bool_],
+    brake: NDArray[np.bool_],
+    turn: NDArray[np.int64],
+    acceleration: float,
+    brake_strength: float,
+    turn_speed: float,
+    friction: float,
+    fitness_weights: NDArray[np.float64],
+    car_shape: NDArray[np.float64],
+    track_mask: NDArray[np.uint8],
+    cp_bounds: NDArray[np.float64],
+    cp_vertices: NDArray[np.float64],
+    cp_vertex_counts: NDArray[np.int64],
+    cp_orders: NDArray[np.int64],
+    cp_grid: NDArray[np.int16],
+    cp_shift: int,
+    finish_bounds: NDArray[np.int64],
+    dt: float
+) -> int:
+
+    """
+    Advances every living car by one physics step, updating its state in place.
+
+    Parameters
+    ----------
+    positions : NDArray[float]
+        The position of each car.
+    velocities : NDArray[float]
+        The velocity of each car along its heading.
+    angles : NDArray[float]
+        The angle of each car, in radians.
+    alive : NDArray[bool]
+        Whether each car is still alive.
+    fitness : NDArray[float]
+        The fitness of each car.
+    checkpoint_idx : NDArray[int]
+        The order of the checkpoint each car must hit next.
+    laps : NDArray[int]
+        The number of laps completed by each car.
+    time_alive : NDArray[float]
+        Time each car has spent alive, in seconds.
+    total_distance : NDArray[float]
+        Forward distance travelled by each car, in pixels.
+    wrong_checkpoints : NDArray[int]
+        The number of wrong checkpoints hit by each car.
+    sensors : NDArray[float]
+        Normalised sensor distances of each car.
+    accelerate : NDArray[bool]
+        Whether each car is accelerating.
+    brake : NDArray[bool]
+        Whether each car is braking.
+    turn : NDArray[int]
+        The turning direction of each car.
+    acceleration : float
+        The acceleration of a car, in pixels/s².
+    brake_strength : float
+        The deceleration of a braking car, in pixels/s².
+    turn_speed : float
+        The turning speed of a car, in radians/s.
+    friction : float
+        The velocity decay applied this step.
+    fitness_weights : NDArray[float]
+        The weight of each term of the fitness score.
+    car_shape : NDArray[float]
+        The scaled, unrotated points of a car's triangle.
+    track_mask : NDArray[uint8]
+        The track's collision mask.
+    cp_bounds : NDArray[float]
+        The bounding box of each checkpoint.
+    cp_vertices : NDArray[float]
+        The padded exterior ring of each checkpoint.
+    cp_vertex_counts : NDArray[int]
+        The number of valid vertices in each checkpoint's ring.
+    cp_orders : NDArray[int]
+        The order of each checkpoint.
+    cp_grid : NDArray[int16]
+        The checkpoint whose bounding box covers each grid cell, -1 if none,
+        or -2 if several do.
+    cp_shift : int
+        The grid's cells are ``2 ** cp_shift`` pixels wide.
+    finish_bounds : NDArray[int]
+        The finish line rectangle as left, top, width and height.
+    dt : float
+        Fixed timestep duration, in seconds.
+
+    Returns
+    -------
+    int
+        The number of cars still alive after the step.
+
+    Notes
+    -----
+    Scores, integrates and checks each car against the track, checkpoints
+    and finish line in a single pass, reading and writing its state once.
+    Mirrors ``Car.fixed_update()``, ``Car.check_track_collision()``,
+    ``Track.check_checkpoint()`` and ``Rect.colliderect()``. Crashed cars
+    are not checked against checkpoints or the finish line.
+    """
+
+    living: int = 0
+
+    for i in range(positions.shape[0]):
+
+        if alive[i]:
+            _step_car(
+                i, positions, velocities, angles, alive, fitness, checkpoint_idx, laps, time_alive,
+                total_distance, wrong_checkpoints, sensors, accelerate, brake, turn,
+                acceleration, brake_strength, turn_speed, friction, fitness_weights, car_shape, track_mask,
+                cp_bounds, cp_vertices, cp_vertex_counts, cp_orders, cp_grid, cp_shift, finish_bounds, dt
+            )
+
+            # Counts the cars that survived the step in the same pass.
+            living += alive[i]
+
+    return living
+
+
+@njit(cache=True, fastmath=_FASTMATH, parallel=True)
+def step_population_parallel(
+    positions: NDArray[np.float64],
+    velocities: NDArray[np.float64],
+    angles: NDArray[np.float64],
+    alive: NDArray[np.bool_],
+    fitness: NDArray[np.float64],
+    checkpoint_idx: NDArray[np.int64],
+    laps: NDArray[np.int64],
+    time_alive: NDArray[np.float64],
+    total_distance: NDArray[np.float64],
+    wrong_checkpoints: NDArray[np.int64],
+    sensors: NDArray[np.float64],
+    accelerate: NDArray[np.bool_],
+    brake: NDArray[np.bool_],
+    turn: NDArray[np.int64],
+    acceleration: float,
+    brake_strength: float,
+    turn_speed: float,
+    friction: float,
+    fitness_weights: NDArray[np.float64],
+    car_shape: NDArray[np.float64],
+    track_mask: NDArray[np.uint8],
+    cp_bounds: NDArray[np.float64],
+    cp_vertices: NDArray[np.float64],
+    cp_vertex_counts: NDArray[np.int64],
+    cp_orders: NDArray[np.int64],
+    cp_grid: NDArray[np.int16],
+    cp_shift: int,
+    finish_bounds: NDArray[np.int64],
+    dt: float
+) -> int:
+
+    """
+    Advances every living car by one physics step across threads.
+
+    Notes
+    -----
+    Takes the same parameters and returns the same count as
+    ``step_population()``. Cars are
+    independent, so the results are identical, but starting the threads
+    has a fixed cost that only pays off for large populations.
+    """
+
+    living: int = 0
+
+    for i in prange(positions.shape[0]):
+
+        if alive[i]:
+            _step_car(
+                i, positions, velocities, angles, alive, fitness, checkpoint_idx, laps, time_alive,
+                total_distance, wrong_checkpoints, sensors, accelerate, brake, turn,
+                acceleration, brake_strength, turn_speed, friction, fitness_weights, car_shape, track_mask,
+                cp_bounds, cp_vertices, cp_vertex_counts, cp_orders, cp_grid, cp_shift, finish_bounds, dt
+            )
+
+            # Counts the cars that survived the step in the same pass.
+            living += alive[i]
+
+    return living
+
+
+@njit(cache=True, parallel=True)
+def sense_population(
+    positions: NDArray[np.float64],
+    angles: NDArray[np.float64],
+    mask: NDArray[np.bool_],
+    sensor_angles: NDArray[np.float64],
+    track_mask: NDArray[np.uint8],
+    max_distance: float,
+    sensors: NDArray[np.float64],
+    changed: NDArray[np.bool_]
+) -> None:
+
+    """
+    Casts every sensor ray of the selected cars using the track's collision mask.
+
+    Parameters
+    ----------
+    positions : NDArray[float]
+        The position of each car, with shape ``(N, 2)``.
+    angles : NDArray[float]
+        The angle of each car, in radians.
+    mask : NDArray[bool]
+        Which cars to update.
+    sensor_angles : NDArray[float]
+        The angle of each sensor relative to a car's heading, in radians.
+    track_mask : NDArray[uint8]
+        The track's collision mask.
+    max_distance : float
+        The maximum distance to check.
+    sensors : NDArray[float]
+        The normalised sensor distances of each car, with shape ``(N, S)``,
+        overwritten in place for the selected cars.
+    changed : NDArray[bool]
+        Set to ``True`` in place for each car whose distances changed.
+
+    Notes
+    -----
+    Samples the same distances as ``Track.raycast()``. Rays are spread
+    across threads, and each one stops at its first collision. Readings
+    are written straight into the population's arrays, so no temporary
+    arrays are allocated.
+    """
+
+    height: int = track_mask.shape[0]
+    width: int = track_mask.shape[1]
+    num_sensors: int = sensor_angles.shape[0]
+
+    base_step: float = 2.0
+
+    for r in prange(positions.shape[0] * num_sensors):
+
+        i: int = r // num_sensors
+
+        if not mask[i]:
+            continue
+
+        s: int = r % num_sensors
+        angle: float = angles[i] + sensor_angles[s]
+        direction_x: float = np.cos(angle)
+        direction_y: float = np.sin(angle)
+        distance: float = 0.0
+
+        while distance < max_distance:
+
+            # Checks current position, truncating towards zero as int() does.
+            ix: int = int(positions[i, 0] + direction_x * distance)
+            iy: int = int(positions[i, 1] + direction_y * distance)
+
+            # Boundary and collision check.
+            if ix < 0 or ix >= width or iy < 0 or iy >= height or track_mask[iy, ix] == 0:
+                break
+
+            distance += base_step
+
+        reading: float = min(distance, max_distance) / max_distance
+
+        # Every ray of a car sets the same flag, so concurrent writes agree.
+        if reading != sensors[i, s]:
+            changed[i] = True
+
+        sensors[i, s] = reading
@@ -3,7 +3,7 @@ import numpy as np
 from numpy.typing import NDArray
 from pygame import Color, Surface, Vector2
 from pygame.draw import line
-from config import CONTROLLER, FITNESS
+from config import COLOURS, CONTROLLER, FITNESS
 from src.algorithm import Genome, NeuralNetwork
 from src.core import Car, Track, Events
 
@@ -273,9 +273,9 @@ class AIController:
         colour: Color | None = None
 
         if is_best:
-            colour = Color(0, 255, 0)
+            colour = COLOURS.CAR_BEST
         elif is_worst:
-            colour = Color(255, 0, 0)
+            colour = COLOURS.CAR_WORST
 
         self.car.draw(screen, colour)
 
@@ -302,7 +302,7 @@ class AIController:
 
             line(
                 screen,
-                Color('#9ee88b'),
+                COLOURS.SENSOR,
                 (self.car.position.x, self.car.position.y),
                 (end_point.x, end_point.y),
                 1
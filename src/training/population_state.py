@@ -0,0 +1,316 @@
+from __future__ import annotations
+
+import pygame
+import numpy as np
+
+from dataclasses import dataclass
+from numpy.typing import NDArray
+from pygame import Color, Surface
+from config import CAR, COLOURS, CONTROLLER
+from ._kernels import sense_population
+
+
+# The angle of each sensor relative to the car's heading, in radians.
+_SENSOR_ANGLES: NDArray[np.float64] = np.radians(CONTROLLER.SENSORS)
+
+
+@dataclass
+class PopulationState:
+
+    """
+    Structure-of-arrays holding the state of every car in a population.
+    Each array is indexed by the car's position in the population.
+
+    Attributes
+    ----------
+    positions : NDArray[float]
+        The position of each car, in pixels, with shape ``(N, 2)``.
+    velocities : NDArray[float]
+        The velocity of each car along its heading, in pixels/s.
+    angles : NDArray[float]
+        The angle of each car, in radians.
+    alive : NDArray[bool]
+        Whether each car is still alive.
+    fitness : NDArray[float]
+        The fitness of each car.
+    checkpoint_idx : NDArray[int]
+        The order of the checkpoint each car must hit next.
+    laps : NDArray[int]
+        The number of laps completed by each car.
+    time_alive : NDArray[float]
+        Time each car has spent alive, in seconds.
+    total_distance : NDArray[float]
+        Forward distance travelled by each car, in pixels.
+    wrong_checkpoints : NDArray[int]
+        The number of wrong checkpoints hit by each car.
+    sensors : NDArray[float]
+        Normalised sensor distances of each car, with shape ``(N, S)``.
+        Distances are -1 until a car first reads its sensors.
+    accelerate : NDArray[bool]
+        Whether each car is accelerating.
+    brake : NDArray[bool]
+        Whether each car is braking.
+    turn : NDArray[int]
+        The turning direction of each car.
+
+    Methods
+    -------
+    create(start_positions: NDArray[float], indices: NDArray[int]) -> PopulationState (static)
+        Creates the state of a population at its starting positions.
+    reset(start_positions: NDArray[float], indices: NDArray[int]) -> None
+        Resets every car to its starting position, reusing the arrays.
+    take(indices: NDArray[int]) -> PopulationState
+        Copies the state of the selected cars.
+    assign(indices: NDArray[int], state: PopulationState) -> None
+        Overwrites the state of the selected cars.
+    update_sensors(track_mask: NDArray[uint8], mask: NDArray[bool]) -> NDArray[bool]
+        Updates the sensor distances of the selected cars.
+    apply_decisions(mask: NDArray[bool], decide: NDArray[bool], outputs: NDArray[float], dt: float) -> None
+        Converts neural network outputs into actions for the selected cars.
+    get_transformed_points(part: str) -> NDArray[float]
+        Gets the points that make up each car's shape.
+    draw(screen: Surface, best_idx: int, worst_idx: int) -> None
+        Draws every car of the population.
+    """
+
+    positions: NDArray[np.float64]
+    velocities: NDArray[np.float64]
+    angles: NDArray[np.float64]
+    alive: NDArray[np.bool_]
+    fitness: NDArray[np.float64]
+    checkpoint_idx: NDArray[np.int64]
+    laps: NDArray[np.int64]
+    time_alive: NDArray[np.float64]
+    total_distance: NDArray[np.float64]
+    wrong_checkpoints: NDArray[np.int64]
+    sensors: NDArray[np.float64]
+    accelerate: NDArray[np.bool_]
+    brake: NDArray[np.bool_]
+    turn: NDArray[np.int64]
+
+    @staticmethod
+    def create(start_positions: NDArray[np.float64], indices: NDArray[np.int64]) -> PopulationState:
+
+        """
+        Creates the state of a population at its starting positions.
+
+        Parameters
+        ----------
+        start_positions : NDArray[float]
+            The available starting positions, assigned to cars in turn.
+        indices : NDArray[int]
+            The index of each car in the whole population.
+
+        Returns
+        -------
+        PopulationState
+            The state of a population where every car is alive and idle.
+        """
+
+        size: int = len(indices)
+        positions: NDArray[np.float64] = np.array(start_positions, dtype=np.float64)[indices % len(start_positions)]
+
+        return PopulationState(
+            positions=positions,
+            velocities=np.zeros(size),
+            angles=np.zeros(size),
+            alive=np.ones(size, dtype=np.bool_),
+            fitness=np.zeros(size),
+            checkpoint_idx=np.zeros(size, dtype=np.int64),
+            laps=np.zeros(size, dtype=np.int64),
+            time_alive=np.zeros(size),
+            total_distance=np.zeros(size),
+            wrong_checkpoints=np.zeros(size, dtype=np.int64),
+            sensors=np.full((size, len(CONTROLLER.SENSORS)), -1.0),
+            accelerate=np.zeros(size, dtype=np.bool_),
+            brake=np.zeros(size, dtype=np.bool_),
+            turn=np.zeros(size, dtype=np.int64)
+        )
+
+    def reset(self, start_positions: NDArray[np.float64], indices: NDArray[np.int64]) -> None:
+
+        """
+        Resets every car to its starting position, reusing the arrays.
+
+        Parameters
+        ----------
+        start_positions : NDArray[float]
+            The available starting positions, assigned to cars in turn.
+        indices : NDArray[int]
+            The index of each car in the whole population.
+
+        Notes
+        -----
+        Leaves the population in the same state as ``create()`` without
+        allocating, so it must already have one car per index.
+        """
+
+        self.positions[:] = np.asarray(start_positions, dtype=np.float64)[indices % len(start_positions)]
+        self.alive.fill(True)
+
+        for array in (
+            self.velocities, self.angles, self.fitness, self.checkpoint_idx, self.laps, self.time_alive,
+            self.total_distance, self.wrong_checkpoints, self.accelerate, self.brake, self.turn
+        ):
+            array.fill(0)
+
+        self.sensors.fill(-1.0)
+
+    def take(self, indices: NDArray[np.int64]) -> PopulationState:
+
+        """
+        Copies the state of the selected cars.
+
+        Parameters
+        ----------
+        indices : NDArray[int]
+            The indices of the cars to copy.
+
+        Returns
+        -------
+        PopulationState
+            The state of the selected cars, in the given order.
+        """
+
+        return PopulationState(**{
+            name: getattr(self, name)[indices] for name in PopulationState.__dataclass_fields__
+        })
+
+    def assign(self, indices: NDArray[np.int64], state: PopulationState) -> None:
+
+        """
+        Overwrites the state of the selected cars.
+
+        Parameters
+        ----------
+        indices : NDArray[int]
+            The indices of the cars to overwrite.
+        state : PopulationState
+            The new state of the selected cars, in the given order.
+        """
+
+        for name in PopulationState.__dataclass_fields__:
+            getattr(self, name)[indices] = getattr(state, name)
+
+    def update_sensors(self, track_mask: NDArray[np.uint8], mask: NDArray[np.bool_]) -> NDArray[np.bool_]:
+
+        """
+        Updates the sensor distances of the selected cars using the track's collision mask.
+
+        Parameters
+        ----------
+        track_mask : NDArray[uint8]
+            The track's collision mask to raycast against.
+        mask : NDArray[bool]
+            Which cars to update.
+
+        Returns
+        -------
+        NDArray[bool]
+            Which cars' sensor distances changed.
+        """
+
+        changed: NDArray[np.bool_] = np.zeros_like(mask)
+
+        # Casts all rays at once, writing the readings straight into the sensor array.
+        sense_population(
+            self.positions, self.angles, mask, _SENSOR_ANGLES, track_mask, CONTROLLER.SENSOR_RANGE,
+            self.sensors, changed
+        )
+
+        return changed
+
+    def apply_decisions(
+        self,
+        mask: NDArray[np.bool_],
+        decide: NDArray[np.bool_],
+        outputs: NDArray[np.float64],
+        dt: float
+    ) -> None:
+
+        """
+        Converts neural network outputs into actions for the selected cars.
+
+        Parameters
+        ----------
+        mask : NDArray[bool]
+            Which cars are making decisions.
+        decide : NDArray[bool]
+            Which of those cars need a new decision. The others keep
+            their previous one.
+        outputs : NDArray[float]
+            The neural network outputs, with one row per car that needs a new decision.
+        dt : float
+            Time since the last AI decisions, in seconds.
+        """
+
+        self.time_alive[mask] += dt
+
+        # Tracks total distance (only forward movement counts).
+        velocities: NDArray[np.float64] = self.velocities[mask]
+        self.total_distance[mask] += np.maximum(velocities, 0.0) * dt
+
+        # Columns are the acceleration, braking, left turn, and right turn probabilities.
+        self.accelerate[decide] = outputs[:, 0] > outputs[:, 1]
+        self.brake[decide] = outputs[:, 1] >= outputs[:, 0]
+        self.turn[decide] = (outputs[:, 3] > 0.5).astype(np.int64) - (outputs[:, 2] > 0.5)
+
+    def get_transformed_points(self, part: str) -> NDArray[np.float64]:
+
+        """
+        Gets the points that make up each car's shape.
+
+        Parameters
+        ----------
+        part : str
+            Which part of the car's shape to get the points for.
+
+        Returns
+        -------
+        NDArray[float]
+            The points of every car, with shape ``(N, P, 2)``.
+
+        Notes
+        -----
+        Mirrors ``Car.get_transformed_points()`` for a whole population at once.
+        """
+
+        shape: NDArray[np.float64] = np.array(CAR.SHAPE[part], dtype=np.float64) * CAR.SIZE
+        cos: NDArray[np.float64] = np.cos(self.angles)[:, None]
+        sin: NDArray[np.float64] = np.sin(self.angles)[:, None]
+
+        # Rotates the shape by each car's angle and moves it to each car's position.
+        xs: NDArray[np.float64] = self.positions[:, 0, None] + shape[:, 0] * cos - shape[:, 1] * sin
+        ys: NDArray[np.float64] = self.positions[:, 1, None] + shape[:, 0] * sin + shape[:, 1] * cos
+
+        return np.stack((xs, ys), axis=-1)
+
+    def draw(self, screen: Surface, best_idx: int, worst_idx: int) -> None:
+
+        """
+        Draws every car of the population.
+
+        Parameters
+        ----------
+        screen : Surface
+            The Pygame surface to draw on.
+        best_idx : int
+            The index of the car to draw in green.
+        worst_idx : int
+            The index of the car to draw in red, unless it is also the best.
+        """
+
+        triangles: list = self.get_transformed_points('triangle').tolist()
+        lines: list = self.get_transformed_points('line').tolist()
+
+        for i, (triangle, line) in enumerate(zip(triangles, lines)):
+
+            colour: Color = COLOURS.CAR_DEFAULT
+
+            if i == best_idx:
+                colour = COLOURS.CAR_BEST
+            elif i == worst_idx:
+                colour = COLOURS.CAR_WORST
+
+            pygame.draw.polygon(screen, colour, triangle, width=2)
+            pygame.draw.line(screen, colour, *line, width=2)
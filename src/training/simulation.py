@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import numba
+import numpy as np
+
+from dataclasses import dataclass
+from numpy.typing import NDArray
+from config import CAR, FITNESS, GAME, TRACK, TRAINING
+from src.algorithm import Genome, PopulationNetwork
+from src.core import Track
+from .population_state import PopulationState
+from ._kernels import step_population, step_population_parallel
+
+
+@dataclass(frozen=True)
+class TrackData:
+
+    """
+    Picklable copy of the track data needed to simulate a population.
+
+    Attributes
+    ----------
+    start_positions : NDArray[float]
+        The starting positions for AI cars, with shape ``(S, 2)``.
+    collision_mask : NDArray[uint8]
+        A 2D array where 1 indicates valid track area, 0 indicates off-track.
+    checkpoint_bounds : NDArray[float]
+        The bounding box of each checkpoint.
+    checkpoint_vertices : NDArray[float]
+        The padded exterior ring of each checkpoint.
+    checkpoint_vertex_counts : NDArray[int]
+        The number of valid vertices in each checkpoint's ring.
+    checkpoint_orders : NDArray[int]
+        The order of each checkpoint.
+    checkpoint_grid : NDArray[int16]
+        The checkpoint whose bounding box covers each grid cell, -1 if none,
+        or -2 if several do.
+    finish_bounds : NDArray[int]
+        The finish line rectangle as left, top, width and height.
+
+    Methods
+    -------
+    from_track(track: Track) -> TrackData (static)
+        Copies the simulation data out of a loaded track.
+    """
+
+    start_positions: NDArray[np.float64]
+    collision_mask: NDArray[np.uint8]
+    checkpoint_bounds: NDArray[np.float64]
+    checkpoint_vertices: NDArray[np.float64]
+    checkpoint_vertex_counts: NDArray[np.int64]
+    checkpoint_orders: NDArray[np.int64]
+    checkpoint_grid: NDArray[np.int16]
+    finish_bounds: NDArray[np.int64]
+
+    @staticmethod
+    def from_track(track: Track) -> TrackData:
+
+        """
+        Copies the simulation data out of a loaded track.
+
+        Parameters
+        ----------
+        track : Track
+            The loaded track.
+
+        Returns
+        -------
+        TrackData
+            The track's simulation data, free of any Pygame objects.
+        """
+
+        return TrackData(
+            start_positions=np.array(track.start_positions, dtype=np.float64).reshape(-1, 2),
+            collision_mask=track.collision_mask,
+            checkpoint_bounds=track.checkpoint_bounds,
+            checkpoint_vertices=track.checkpoint_vertices,
+            checkpoint_vertex_counts=track.checkpoint_vertex_counts,
+            checkpoint_orders=track.checkpoint_orders,
+            checkpoint_grid=track.checkpoint_grid,
+            finish_bounds=track.finish_bounds
+        )
+
+
+# The scaled, unrotated points of a car's triangle.
+_CAR_SHAPE: NDArray[np.float64] = np.array(CAR.SHAPE['triangle'], dtype=np.float64) * CAR.SIZE
+
+# The turning speed of a car, in radians/s.
+_TURN_SPEED: float = float(np.radians(CAR.TURN_SPEED))
+
+# The weight of each term of the fitness score, in the order the step kernel adds them.
+_FITNESS_WEIGHTS: NDArray[np.float64] = np.array([
+    FITNESS.REWARD_DISTANCE,
+    FITNESS.REWARD_CHECKPOINT,
+    FITNESS.PENALTY_WRONG_CHECKPOINT,
+    FITNESS.REWARD_LAP,
+    FITNESS.REWARD_SAFETY,
+    FITNESS.REWARD_VELOCITY,
+    FITNESS.PENALTY_TIME
+], dtype=np.float64)
+
+# The track simulated by this worker process, set by init_worker().
+_worker_track: TrackData | None = None
+
+
+def step_simulation(
+    population: PopulationState,
+    network: PopulationNetwork,
+    track: TrackData,
+    dt: float,
+    run_ai: bool
+) -> int:
+
+    """
+    Advances every living car of a population by one physics step.
+
+    Parameters
+    ----------
+    population : PopulationState
+        The state of the population, updated in place.
+    network : PopulationNetwork
+        The neural networks driving the cars.
+    track : TrackData
+        The track being raced on.
+    dt : float
+        Fixed timestep duration, in seconds.
+    run_ai : bool
+        Whether the AI should make a decision this physics step.
+
+    Returns
+    -------
+    int
+        The number of cars still alive after the step.
+    """
+
+    alive: NDArray[np.bool_] = population.alive
+
+    if not alive.any():
+        return 0
+
+    if run_ai:
+
+        # Networks are deterministic, so cars whose sensor readings did not change keep their last decision.
+        decide: NDArray[np.bool_] = population.update_sensors(track.collision_mask, alive)
+
+        # Runs the networks of the remaining cars on their own sensor readings at once.
+        outputs: NDArray[np.float64] = network.forward(population.sensors, decide)[decide]
+
+        population.apply_decisions(alive, decide, outputs, dt * TRAINING.INTERVAL)
+
+    # Spreads large populations across threads, where it outweighs the cost of starting them.
+    step = step_population_parallel if len(alive) >= TRAINING.PARALLEL_STEP_SIZE else step_population
+
+    # Scores, integrates and checks every living car in a single compiled pass.
+    return step(
+        population.positions, population.velocities, population.angles, population.alive, population.fitness,
+        population.checkpoint_idx, population.laps, population.time_alive, population.total_distance,
+        population.wrong_checkpoints, population.sensors, population.accelerate, population.brake, population.turn,
+        CAR.ACCELERATION, CAR.BRAKE_STRENGTH, _TURN_SPEED, CAR.FRICTION ** (dt * 60),
+        _FITNESS_WEIGHTS, _CAR_SHAPE, track.collision_mask,
+        track.checkpoint_bounds, track.checkpoint_vertices, track.checkpoint_vertex_counts, track.checkpoint_orders,
+        track.checkpoint_grid, TRACK.CHECKPOINT_CELL_SHIFT, track.finish_bounds, dt
+    )
+
+
+def warm_up(track: TrackData, size: int) -> None:
+
+    """
+    Compiles the simulation's kernels, or loads them from Numba's cache.
+
+    Parameters
+    ----------
+    track : TrackData
+        The track being raced on.
+    size : int
+        The number of cars that will be simulated at once.
+
+    Notes
+    -----
+    Steps a throwaway population, so the first real physics step does not
+    stall while the kernels are prepared.
+    """
+
+    population: PopulationState = PopulationState.create(track.start_positions, np.arange(size))
+
+    population.update_sensors(track.collision_mask, population.alive)
+    step_simulation(population, PopulationNetwork.from_genomes([]), track, GAME.FIXED_DT, run_ai=False)
+
+
+def init_worker(track: TrackData) -> None:
+
+    """
+    Prepares a worker process, storing the track so it is only sent once.
+
+    Parameters
+    ----------
+    track : TrackData
+        The track being raced on.
+    """
+
+    global _worker_track
+    _worker_track = track
+
+    # Workers already run in parallel, so compiled kernels use a single thread each.
+    numba.set_num_threads(1)
+    warm_up(track, 1)
+
+
+def simulate_shard(genomes: list[Genome], indices: NDArray[np.int64]) -> tuple[PopulationState, float]:
+
+    """
+    Simulates a slice of the population until every car dies or time runs out.
+
+    Parameters
+    ----------
+    genomes : list[Genome]
+        The genomes of the cars in this slice.
+    indices : NDArray[int]
+        The index of each car of the slice in the whole population.
+
+    Returns
+    -------
+    tuple[PopulationState, float]
+        The final state of the slice, and the simulated time, in seconds.
+
+    Notes
+    -----
+    Must be run in a process initialised with ``init_worker()``.
+    """
+
+    track: TrackData = _worker_track
+    network: PopulationNetwork = PopulationNetwork.from_genomes(genomes)
+    population: PopulationState = PopulationState.create(track.start_positions, indices)
+
+    timer: float = 0.0
+    step: int = 0
+    alive_count: int = len(indices)
+
+    while alive_count > 0 and timer < TRAINING.MAX_GENERATION_TIME:
+
+        alive_count = step_simulation(population, network, track, GAME.FIXED_DT, step % TRAINING.INTERVAL == 0)
+        timer += GAME.FIXED_DT
+        step += 1
+
+    return population, timer
@@ -1,21 +1,42 @@
 import pygame
+import numpy as np
 import multiprocessing as mp
+import threading
+import time
 
 from typing import Any
+from collections import OrderedDict
+from multiprocessing.shared_memory import SharedMemory
+from concurrent.futures import Future, ProcessPoolExecutor, wait
 from pathlib import Path
-from queue import Empty
-from pygame import Vector2, Surface
+from queue import Empty, Full, Queue
+from numpy.typing import NDArray
+from pygame import Surface
 from pygame.time import Clock
 from config import COLOURS, FONTS, TRAINING, GAME, CONTROLLER
-from src.algorithm import GeneticAlgorithm, Genome
+from src.algorithm import GeneticAlgorithm, Genome, PopulationNetwork
 from src.io import GenomeIO
-from src.core.car import Car, Track
-from src.core.utils import draw_outlined_text
+from src.core.car import Track
+from src.core.utils import draw_outlined_text, init_pygame, quit_pygame, render_outlined_text
 from src.ui import Button, plotting_process
-from .ai_controller import AIController
+from .population_state import PopulationState
+from .simulation import TrackData, init_worker, simulate_shard, step_simulation, warm_up
 from ..core import Events
 
 
+# The labels of the stats overlay's rows.
+_OVERLAY_LABELS: tuple[str, ...] = (
+    "Generation: ", "Alive: ", "Time: ", "Best Fitness: ", "Avg Fitness: ", "Best CP: "
+)
+
+# The outline thickness of the stats overlay's text, which pads each rendered surface.
+_OVERLAY_OUTLINE: int = 2
+
+# The events that control the training loop, and the ones its buttons respond to.
+_CONTROL_EVENTS: tuple[int, ...] = (pygame.QUIT, pygame.KEYDOWN)
+_BUTTON_EVENTS: tuple[int, ...] = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN)
+
+
 class TrainingLoop:
 
     """
@@ -41,7 +62,7 @@ class TrainingLoop:
             output_size=4
         )
 
-        pygame.init()
+        init_pygame()
 
         self._screen: Surface = pygame.display.set_mode((GAME.SCREEN_WIDTH, GAME.SCREEN_HEIGHT))
         self._clock: Clock = Clock()
@@ -84,11 +105,32 @@ class TrainingLoop:
             text="Stop Training"
         )
 
+        # Tracks which button the mouse is over, so moving within it skips hit-testing the others.
+        self._buttons: tuple[Button, ...] = (self._toggle_button, self._stop_button, self._graph_button)
+        self._hovered_button: Button | None = None
+
+        # Pre-renders the stats overlay's background and labels.
+        self._overlay_background: Surface = Surface((350, 160))
+        self._overlay_background.set_alpha(200)
+        self._overlay_background.fill(COLOURS.ITEM_UNSELECTED)
+
+        self._overlay_labels: list[Surface] = [
+            render_outlined_text(label, font_size=FONTS.SIZE_NORMAL)
+            for label in _OVERLAY_LABELS
+        ]
+
+        self._overlay_values: list[tuple[str, Surface | None]] = [("", None)] * len(_OVERLAY_LABELS)
+
         # Genome saving configuration.
         self._save_interval: int = TRAINING.AUTOSAVE_INTERVAL
         self._save_dir: Path = Path("./data/genomes")
         self._save_dir.mkdir(exist_ok=True)
 
+        # Saves genomes in the background, so writing them does not delay the next generation.
+        self._save_queue: Queue[tuple[list[Genome], int] | None] = Queue()
+        self._save_thread: threading.Thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._save_thread.start()
+
         # Shows a loading screen.
         self._screen.fill(COLOURS.BACKGROUND)
         draw_outlined_text(
@@ -102,9 +144,42 @@ class TrainingLoop:
 
         # Loads the track - takes time!
         self._track: Track = Track(track_path)
+        self._track_data: TrackData = TrackData.from_track(self._track)
         self._num_checkpoints: int = len(self._track.checkpoints)
 
-        self._controllers: list[AIController] = []
+        # Prepares the compiled physics kernels while the loading screen is up.
+        warm_up(self._track_data, TRAINING.POPULATION_SIZE)
+
+        self._genomes: list[Genome] = []
+        self._network: PopulationNetwork = PopulationNetwork.from_genomes([])
+        self._population: PopulationState = PopulationState.create(self._track_data.start_positions, np.arange(0))
+
+        # Remembers the final state of evaluated cars, so unchanged genomes are not simulated again.
+        # Keys are a genome's checksum and starting position, as both determine the outcome.
+        self._fitness_cache: OrderedDict[tuple[str, int], PopulationState] = OrderedDict()
+        self._cache_keys: list[tuple[str, int]] = []
+        self._cached: NDArray[np.bool_] = np.zeros(0, dtype=np.bool_)
+        self._cached_survivors: NDArray[np.bool_] = np.zeros(0, dtype=np.bool_)
+
+        # Evaluates generations across worker processes in console mode.
+        self._num_workers: int = max(1, min(TRAINING.WORKERS, TRAINING.POPULATION_SIZE))
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending_shards: list[tuple[NDArray[np.int64], Future]] = []
+
+        # When the pending shards were submitted, and when their progress was last printed, in wall time.
+        self._shards_submitted_time: float = 0.0
+        self._last_shard_status_time: float = 0.0
+
+        # Counts the living cars, updated by every physics step.
+        self._alive_count: int = 0
+
+        # Caches population stats, only recalculated after the population changes.
+        self._stats_dirty: bool = True
+        self._best_idx: int = 0
+        self._worst_idx: int = 0
+        self._best_fitness: float = 0.0
+        self._worst_fitness: float = 0.0
+        self._avg_fitness: float = 0.0
         self._generation_timer: float = 0.0
         self._physics_step_count: int = 0
         self._total_generations: int = 0
@@ -114,16 +189,22 @@ class TrainingLoop:
         self._status_update_interval: float = 5.0
         self._last_status_time: float = 0.0
 
-        # Saves stats for display with seaborn.
-        self._plot_background_sent: bool = False
-        self._plot_history: dict[str, list[Any]] = {
-            'generations': [],
-            'best_fitness': [],
-            'avg_fitness': [],
-            'worst_fitness': [],
-            'fitness_std': [],
-            'death_positions': []
-        }
+        # Saves stats for display in the graph window.
+        # The track background is shared with the plotting process instead of being sent through its queue.
+        self._plot_background: SharedMemory | None = None
+        self._plot_background_shape: tuple[int, ...] = ()
+
+        # Keeps the position of every crash in a buffer that doubles in size when full.
+        self._death_positions: NDArray[np.float32] = np.zeros((1024, 2), dtype=np.float32)
+        self._death_count: int = 0
+
+        # How much of the history and crashes the plotting process has received, as it keeps its own copy.
+        self._plot_history_sent: int = 0
+        self._plot_deaths_sent: int = 0
+
+        # Keeps the generation, best, average, and worst fitness of recent generations in a ring buffer.
+        self._fitness_history: NDArray[np.float32] = np.zeros((TRAINING.MAX_HISTORY, 4), dtype=np.float32)
+        self._history_len: int = 0
 
         # Force renders the checkpoints.
         Events.on_keypress_checkpoints.broadcast()
@@ -143,34 +224,98 @@ class TrainingLoop:
         print(f"Track loaded: {self._num_checkpoints} checkpoints")
         print(f"Population: {TRAINING.POPULATION_SIZE} cars")
         print(f"Training speed: {self._current_speed}x")
+        print(f"Worker processes: {self._num_workers}")
         print(f"Save directory: {self._save_dir.absolute()}")
         print("=" * 60)
 
     def _create_generation(self) -> None:
 
         """
-        Creates a new generation of AI controllers.
+        Creates a new generation of AI-controlled cars.
         """
 
-        # Disposes of any existing controllers.
-        for controller in self._controllers:
-            controller.dispose()
-
-        self._controllers = []
         self._generation_timer = 0.0
         self._physics_step_count = 0
         self._last_status_time = 0.0
 
-        # Creates a controller for each genome in the population.
-        for i, (genome, _) in enumerate(self.genetic_algorithm.population):
+        # Creates batched networks and a single state for the whole population.
+        self._genomes = [genome for genome, _ in self.genetic_algorithm.population]
+        self._network = PopulationNetwork.from_genomes(self._genomes)
+        indices: NDArray[np.int64] = np.arange(len(self._genomes))
+
+        # Reuses the previous generation's arrays when the population size has not changed.
+        if len(self._population.alive) == len(self._genomes):
+            self._population.reset(self._track_data.start_positions, indices)
+        else:
+            self._population = PopulationState.create(self._track_data.start_positions, indices)
 
-            start_pos: Vector2 = self._track.start_positions[i % len(self._track.start_positions)]
-            car: Car = Car(start_pos=start_pos)
-            controller: AIController = AIController(car, genome)
-            self._controllers.append(controller)
+        self._stats_dirty = True
+
+        self._restore_cached_cars()
+
+        # Counts the cars left to simulate once, then keeps the count up to date as they crash.
+        self._alive_count = int(np.count_nonzero(self._population.alive))
 
         print(f"\nGeneration {self.genetic_algorithm.generation} started.")
 
+    def _restore_cached_cars(self) -> None:
+
+        """
+        Restores the final state of cars whose genome was already evaluated.
+
+        Notes
+        -----
+        Cars are independent and the simulation is deterministic, so a
+        genome starting from the same position always ends the same way.
+        Restored cars are marked as dead so they are not simulated again.
+
+        Nothing is restored while the training is being watched, as a
+        restored car would be drawn where it ended before it had moved.
+        """
+
+        num_start_positions: int = len(self._track_data.start_positions)
+        self._cache_keys = [
+            (genome.checksum(), i % num_start_positions) for i, genome in enumerate(self._genomes)
+        ]
+
+        self._cached = np.zeros(len(self._genomes), dtype=np.bool_)
+        self._cached_survivors = self._cached
+
+        if self._visual_mode:
+            return
+
+        for i, key in enumerate(self._cache_keys):
+
+            state: PopulationState | None = self._fitness_cache.get(key)
+
+            if state is None:
+                continue
+
+            self._fitness_cache.move_to_end(key)
+            self._population.assign(np.array([i]), state)
+            self._cached[i] = True
+
+        # Cars that were still alive when time ran out did not crash.
+        self._cached_survivors = self._cached & self._population.alive
+        self._population.alive[self._cached] = False
+
+    def _cache_evaluated_cars(self) -> None:
+
+        """
+        Stores the final state of every car simulated this generation.
+
+        Notes
+        -----
+        The least recently used entries are evicted once the cache holds
+        more than ``TRAINING.FITNESS_CACHE_SIZE`` cars.
+        """
+
+        for i in np.flatnonzero(~self._cached):
+            self._fitness_cache[self._cache_keys[i]] = self._population.take(np.array([i]))
+
+        while len(self._fitness_cache) > TRAINING.FITNESS_CACHE_SIZE:
+            self._fitness_cache.popitem(last=False)
+
     def run(self) -> str | None:
 
         """
@@ -182,41 +327,100 @@ class TrainingLoop:
             'QUIT' if window was closed, ``None`` if ESC was pressed.
         """
 
+        # Binds the names used every frame once, outside the main loop.
+        fixed_dt: float = GAME.FIXED_DT
+        fps: int = GAME.FPS
+        clock_tick = self._clock.tick
+        fixed_update = self._fixed_update
+
+        # Console mode only handles events and redraws its window a few times per second.
+        gui_interval: float = 1.0 / TRAINING.CONSOLE_FPS
+        last_time: float = time.perf_counter()
+        next_gui_time: float = last_time
+
+        # Has SDL drop every event the training loop ignores, instead of queueing it.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_CONTROL_EVENTS + _BUTTON_EVENTS)
+
         try:
 
             while self._running:
 
-                result = self._process_events()
+                now: float = time.perf_counter()
+                refresh_gui: bool = self._visual_mode or now >= next_gui_time
+
+                if refresh_gui:
 
-                # If X button was clicked, returns immediately.
-                if result == 'QUIT':
+                    result = self._process_events()
+                    next_gui_time = now + gui_interval
 
-                    pygame.quit()
-                    return 'QUIT'
+                    # If X button was clicked, returns immediately.
+                    if result == 'QUIT':
+
+                        quit_pygame()
+                        return 'QUIT'
 
                 # Runs at normal speed if visualising the training.
                 # Otherwise, runs at whatever training speed is specified in the config.
                 self._current_speed = 1 if self._visual_mode else TRAINING.SPEED
 
-                # Calculates delta time and adds to the fixed accumulator.
-                dt: float = self._clock.tick(GAME.FPS) / 1000.0
-                self._accumulator += dt * self._current_speed
+                # Calculates delta time.
+                # Console mode is not capped to the frame rate, so it is measured directly.
+                if self._visual_mode:
+                    dt: float = clock_tick(fps) / 1000.0
+                else:
+                    dt = now - last_time
+
+                last_time = now
+
+                # Evaluates whole generations across worker processes in console mode.
+                # A generation that is already being evaluated is finished first.
+                if self._num_workers > 1 and (not self._visual_mode or self._pending_shards):
+
+                    # Waits on the workers until the window next needs refreshing.
+                    timeout: float = 0.0 if self._visual_mode else max(0.0, next_gui_time - time.perf_counter())
+                    self._update_parallel(timeout)
+
+                else:
+
+                    accumulator: float = self._accumulator + dt * self._current_speed
+                    visual_mode: bool = self._visual_mode
+
+                    # Caps physics steps per frame to keep UI responsive.
+                    # Console mode only redraws a few times per second, so it steps until the next redraw is due.
+                    steps_this_frame = 0
+                    max_steps = 50
+
+                    # Fixed timestep loop for deterministic physics.
+                    while accumulator >= fixed_dt:
+
+                        if visual_mode and steps_this_frame >= max_steps:
+                            break
+
+                        if not visual_mode and time.perf_counter() >= next_gui_time:
+                            break
 
-                # Caps physics steps per frame to keep UI responsive.
-                steps_this_frame = 0
-                max_steps = 50
+                        fixed_update(fixed_dt)
+                        self._generation_timer += fixed_dt
+                        accumulator -= fixed_dt
+                        steps_this_frame += 1
 
-                # Fixed timestep loop for deterministic physics.
-                while self._accumulator >= GAME.FIXED_DT and steps_this_frame < max_steps:
+                        # Stops as soon as the generation ends, so it is not stepped past its time limit.
+                        if self._is_generation_complete():
+                            break
 
-                    self._fixed_update(GAME.FIXED_DT)
-                    self._generation_timer += GAME.FIXED_DT
-                    self._accumulator -= GAME.FIXED_DT
-                    steps_this_frame += 1
+                    # Resets the accumulator if visual mode falls too far behind.
+                    if visual_mode and accumulator > fixed_dt * max_steps:
+                        accumulator = 0.0
 
-                # Resets the accumulator.
-                if self._accumulator > GAME.FIXED_DT * max_steps:
-                    self._accumulator = 0.0
+                    self._accumulator = accumulator
+
+                    # Sleeps until the next physics step is due, rather than spinning.
+                    if not visual_mode:
+                        time.sleep(max(0.0, min(
+                            (fixed_dt - accumulator) / self._current_speed,
+                            next_gui_time - time.perf_counter()
+                        )))
 
                 # Prints periodic status updates in console mode.
                 if not self._visual_mode:
@@ -227,7 +431,7 @@ class TrainingLoop:
                 # Renders based on current mode.
                 if self._visual_mode:
                     self._draw_visual()
-                else:
+                elif refresh_gui:
                     self._draw_minimal_gui()
 
                 # Checks if generation is complete.
@@ -240,13 +444,27 @@ class TrainingLoop:
             print("Training interrupted.")
             self._print_final_stats()
 
-        # Cleans up plotting process.
-        if self._plot_queue is not None:
-            self._plot_queue.put(None)
-        if self._plot_process is not None:
-            self._plot_process.join(timeout=1)
+        finally:
+
+            # Cleans up worker processes.
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+
+            # Cleans up plotting process.
+            self._stop_plotting()
+            if self._plot_background is not None:
+                self._plot_background.close()
+                self._plot_background.unlink()
 
-        pygame.quit()
+            # Finishes any pending genome saves.
+            self._save_queue.put(None)
+            self._save_thread.join()
+
+            # Lets every event through again for the menus, unless Pygame has already been shut down.
+            if pygame.display.get_init():
+                pygame.event.set_allowed(None)
+
+        quit_pygame()
         return None
 
     def _process_events(self) -> str | None:
@@ -260,29 +478,48 @@ class TrainingLoop:
             'QUIT' if X button clicked, None otherwise.
         """
 
-        for event in pygame.event.get():
+        for event in pygame.event.get(_CONTROL_EVENTS):
 
             if event.type == pygame.QUIT:
                 self._running = False
                 return 'QUIT'
 
-            elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self._running = False
+                return None
+
+            elif event.key == pygame.K_SPACE:
+                self._toggle_mode()
 
-                if event.key == pygame.K_ESCAPE:
-                    self._running = False
-                    return None
+        # Only dispatches mouse events to the buttons.
+        for event in pygame.event.get(_BUTTON_EVENTS):
 
-                elif event.key == pygame.K_SPACE:
-                    self._toggle_mode()
+            hovered: Button | None = self._hovered_button
 
-            if self._toggle_button.handle_event(event):
+            if event.type == pygame.MOUSEMOTION:
+
+                # Buttons do not overlap, so moving within the hovered one cannot change any button's state.
+                if hovered is not None and hovered.rect.collidepoint(event.pos):
+                    continue
+
+                for button in self._buttons:
+                    button.handle_event(event)
+
+                self._hovered_button = next((button for button in self._buttons if button.is_hovered), None)
+                continue
+
+            # Only the hovered button can be clicked.
+            if hovered is None or not hovered.handle_event(event):
+                continue
+
+            if hovered is self._toggle_button:
                 self._toggle_mode()
 
-            if self._stop_button.handle_event(event):
+            elif hovered is self._stop_button:
                 self._running = False
                 return None
 
-            if self._graph_button.handle_event(event):
+            elif hovered is self._graph_button:
                 self._toggle_graphs()
 
         return None
@@ -295,35 +532,77 @@ class TrainingLoop:
 
         if self._plot_process is None or not self._plot_process.is_alive():
 
+            # Publishes the track background before starting the process, so it can attach on startup.
+            self._share_track_background()
+
             # Starts the plotting process.
-            self._plot_queue = mp.Queue()
-            self._plot_process = mp.Process(target=plotting_process, args=(self._plot_queue,))
+            # The queue is bounded, so a slow plotter makes the training loop skip updates instead of stalling it.
+            self._plot_queue = mp.Queue(maxsize=2)
+            self._plot_process = mp.Process(
+                target=plotting_process,
+                args=(self._plot_queue, self._plot_background.name, self._plot_background_shape)
+            )
             self._plot_process.start()
-            self._plot_background_sent = False
+            self._plot_history_sent = 0
+            self._plot_deaths_sent = 0
             self._graph_button.text = "Hide Graphs"
 
         else:
 
-            # Drains the queue before sending shutdown signal.
-            if self._plot_queue is not None:
+            self._stop_plotting()
+            self._graph_button.text = "Show Graphs"
 
-                try:
-                    while not self._plot_queue.empty():
-                        self._plot_queue.get_nowait()
-                except Empty:
-                    pass
+    def _stop_plotting(self) -> None:
 
-                self._plot_queue.put(None)
+        """
+        Shuts down the plotting process, if running.
+        """
 
-            if self._plot_process is not None:
+        if self._plot_queue is not None:
 
-                self._plot_process.join(timeout=1)
-                if self._plot_process.is_alive():
-                    self._plot_process.terminate()
+            # Drains the queue before sending shutdown signal, so it has room for it.
+            try:
+                while True:
+                    self._plot_queue.get_nowait()
+            except Empty:
+                pass
 
-            self._plot_process = None
-            self._plot_queue = None
-            self._graph_button.text = "Show Graphs"
+            # The process is terminated below if the signal still does not fit.
+            try:
+                self._plot_queue.put_nowait(None)
+            except Full:
+                pass
+
+        if self._plot_process is not None:
+
+            self._plot_process.join(timeout=1)
+            if self._plot_process.is_alive():
+                self._plot_process.terminate()
+
+        self._plot_process = None
+        self._plot_queue = None
+
+    def _share_track_background(self) -> None:
+
+        """
+        Copies the track background into shared memory, if not already done.
+
+        Notes
+        -----
+        The background never changes, so it is copied once and reused every
+        time the graph window is opened, until the training loop exits.
+        """
+
+        if self._plot_background is not None:
+            return
+
+        background: NDArray[np.uint8] = pygame.surfarray.array3d(self._track.background).transpose(1, 0, 2)
+
+        self._plot_background = SharedMemory(create=True, size=background.nbytes)
+        self._plot_background_shape = background.shape
+
+        shared: NDArray[np.uint8] = np.ndarray(background.shape, dtype=np.uint8, buffer=self._plot_background.buf)
+        shared[:] = background
 
     def _send_plot_data(self) -> None:
 
@@ -331,51 +610,104 @@ class TrainingLoop:
         Collects stats and sends to plotting process if open.
         """
 
-        fitness_values: list[float] = [c.fitness for c in self._controllers]
-        checkpoints: list[int] = [c.car.current_checkpoint for c in self._controllers]
-        laps: list[int] = [c.car.laps_completed for c in self._controllers]
-        survival_times: list[float] = [c.time_alive for c in self._controllers]
+        self._update_stats()
+
+        population: PopulationState = self._population
 
         # Collects death positions from cars that died this generation.
-        death_positions: list[tuple[float, float]] = [
-            (c.car.position.x, c.car.position.y)
-            for c in self._controllers if not c.is_alive
-        ]
+        # Restored cars are never alive, so the ones that survived are skipped.
+        crashed: NDArray[np.bool_] = ~population.alive & ~self._cached_survivors
+        self._add_death_positions(population.positions[crashed])
 
         # Always collects history.
-        self._plot_history['generations'].append(self.genetic_algorithm.generation - 1)
-        self._plot_history['best_fitness'].append(max(fitness_values))
-        self._plot_history['avg_fitness'].append(sum(fitness_values) / len(fitness_values))
-        self._plot_history['worst_fitness'].append(min(fitness_values))
-        self._plot_history['death_positions'].extend(death_positions)
+        self._fitness_history[self._history_len % TRAINING.MAX_HISTORY] = (
+            self.genetic_algorithm.generation - 1,
+            self._best_fitness,
+            self._avg_fitness,
+            self._worst_fitness
+        )
+
+        self._history_len += 1
 
         # Only sends information if the plot window is open.
         if self._plot_queue is None:
             return
 
+        # Only sends the generations and crashes the plotting process has not received yet.
+        # Every array sent is copied, as the queue pickles them in the background while the buffers keep changing.
+        history: NDArray[np.float32] = self._get_fitness_history()
+        history = history[len(history) - min(self._history_len - self._plot_history_sent, len(history)):].copy()
+        death_positions: NDArray[np.float32] = self._death_positions[self._plot_deaths_sent:self._death_count].copy()
+
         data: dict[str, Any] = {
-            # Full history.
-            'generations': self._plot_history['generations'].copy(),
-            'best_fitness': self._plot_history['best_fitness'].copy(),
-            'avg_fitness': self._plot_history['avg_fitness'].copy(),
-            'worst_fitness': self._plot_history['worst_fitness'].copy(),
-            'death_positions': self._plot_history['death_positions'].copy(),
+            # New history, as rows of generation, best, average and worst fitness.
+            'history': history,
+            'death_positions': death_positions,
 
             # Current generation data.
             'current_gen': self.genetic_algorithm.generation - 1,
-            'fitness_distribution': fitness_values,
-            'checkpoints': checkpoints,
-            'laps': laps,
-            'survival_times': survival_times
+            'fitness_distribution': population.fitness.copy(),
+            'checkpoints': population.checkpoint_idx.copy(),
+            'laps': population.laps.copy(),
+            'survival_times': population.time_alive.copy()
         }
 
-        # Includes track background on first send after plot window opens.
-        if not self._plot_background_sent:
+        # Skips this update if the plotter is behind, rather than waiting for it.
+        # What was not sent is included in the next update, as the counts only advance once sent.
+        try:
+            self._plot_queue.put_nowait(data)
+        except Full:
+            return
+
+        self._plot_history_sent = self._history_len
+        self._plot_deaths_sent = self._death_count
+
+    def _add_death_positions(self, positions: NDArray[np.float64]) -> None:
+
+        """
+        Records the positions where cars crashed.
+
+        Parameters
+        ----------
+        positions : NDArray[float]
+            The positions of the crashed cars, with shape ``(N, 2)``.
+        """
+
+        end: int = self._death_count + len(positions)
+
+        # Doubles the buffer when full, so recording stays amortised O(1) per crash.
+        if end > len(self._death_positions):
+
+            grown: NDArray[np.float32] = np.zeros((max(end, 2 * len(self._death_positions)), 2), dtype=np.float32)
+            grown[:self._death_count] = self._death_positions[:self._death_count]
+            self._death_positions = grown
+
+        self._death_positions[self._death_count:end] = positions
+        self._death_count = end
+
+    def _get_fitness_history(self) -> NDArray[np.float32]:
 
-            data['track_bg'] = pygame.surfarray.array3d(self._track.background).transpose(1, 0, 2)  # type: ignore
-            self._plot_background_sent = True
+        """
+        Gets the recorded fitness history in chronological order.
+
+        Returns
+        -------
+        NDArray[np.float32]
+            An array with the generation, best, average, and worst fitness
+            of each recorded generation, oldest first.
 
-        self._plot_queue.put(data)
+        Notes
+        -----
+        Only the last ``TRAINING.MAX_HISTORY`` generations are kept. The array
+        is a view of the ring buffer until it first wraps around.
+        """
+
+        if self._history_len <= TRAINING.MAX_HISTORY:
+            return self._fitness_history[:self._history_len]
+
+        # Rotates the buffer so the oldest generation comes first.
+        start: int = self._history_len % TRAINING.MAX_HISTORY
+        return np.concatenate((self._fitness_history[start:], self._fitness_history[:start]))
 
     def _toggle_mode(self) -> None:
 
@@ -411,63 +743,111 @@ class TrainingLoop:
 
         Notes
         -----
-        The AI controller only makes decisions every ``TRAINING_INTERVAL``
-        physics steps for performance, while maintaining determinism.
+        The AI only makes decisions every ``TRAINING_INTERVAL`` physics
+        steps for performance, while maintaining determinism. The whole
+        population is updated at once through its ``PopulationState``.
         """
 
-        # Checks whether the AI controller should make a decision this physics step.
+        # Checks whether the AI should make a decision this physics step.
         run_ai: bool = (self._physics_step_count % TRAINING.INTERVAL == 0)
 
-        # Updates all living controllers and cars.
-        for controller in self._controllers:
+        # Updates all living cars at once.
+        self._alive_count = step_simulation(self._population, self._network, self._track_data, dt, run_ai)
 
-            if not controller.is_alive:
-                continue
+        self._physics_step_count += 1
+        self._stats_dirty = True
+
+    def _update_stats(self) -> None:
+
+        """
+        Recalculates the cached population stats if the population has changed.
 
-            if run_ai:
-                controller.update_sensors(self._track)
-                controller.make_decision(dt * TRAINING.INTERVAL)
+        Notes
+        -----
+        Stats are read several times per frame, so they are calculated
+        in a single pass and reused until the next physics step.
+        """
 
-            controller.fixed_update()
-            controller.car.fixed_update(dt)
+        if not self._stats_dirty:
+            return
 
-            # Handles collisions directly without event system.
-            self._handle_collisions(controller)
+        fitness: NDArray[np.float64] = self._population.fitness
+        self._stats_dirty = False
 
-        self._physics_step_count += 1
+        if len(fitness) == 0:
+            return
 
-    def _handle_collisions(self, controller: AIController) -> None:
+        self._best_idx = int(np.argmax(fitness))
+        self._best_fitness = float(fitness[self._best_idx])
+        self._worst_idx = int(np.argmin(fitness))
+        self._worst_fitness = float(fitness[self._worst_idx])
+        self._avg_fitness = float(fitness.mean())
+
+    def _update_parallel(self, timeout: float = 0.0) -> None:
 
         """
-        Handles collision and checkpoint detection for a single controller.
+        Evaluates the current generation across worker processes.
 
         Parameters
         ----------
-        controller : AIController
-            The AI controller to check collisions for.
+        timeout : float, optional
+            How long to wait for the workers to finish, in seconds.
 
         Notes
         -----
-        Uses direct method calls instead of the event system for performance.
-        Uses the track's fast collision mask for O(1) point-in-track checks.
+        The population is split into one shard per worker, each simulated
+        until every car dies or time runs out. Results are only collected
+        once every shard has finished, so the window stays responsive.
         """
 
-        car: Car = controller.car
+        if self._executor is None:
+
+            # Sends the track to each worker only once.
+            # Workers are spawned, as forking after Numba has started its threads can deadlock them.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._num_workers,
+                mp_context=mp.get_context('spawn'),
+                initializer=init_worker,
+                initargs=(self._track_data,)
+            )
+
+        # Submits the generation if it has not been yet.
+        if not self._pending_shards:
+
+            # Cached cars are already evaluated, so only the rest are simulated.
+            shards: list[NDArray[np.int64]] = np.array_split(np.flatnonzero(~self._cached), self._num_workers)
+            self._pending_shards = [
+                (shard, self._executor.submit(simulate_shard, [self._genomes[i] for i in shard], shard))
+                for shard in shards if len(shard) > 0
+            ]
+
+            self._shards_submitted_time = time.perf_counter()
+            self._last_shard_status_time = self._shards_submitted_time
+
+        # Waits for the shards, returning if any are still running.
+        _, not_done = wait([future for _, future in self._pending_shards], timeout)
+
+        if not_done:
+
+            # Prints periodic progress in console mode, as the generation timer only advances once every shard is done.
+            now: float = time.perf_counter()
+
+            if not self._visual_mode and now - self._last_shard_status_time >= self._status_update_interval:
+                self._print_shard_status(len(self._pending_shards) - len(not_done), now)
+                self._last_shard_status_time = now
 
-        # Checks for collisions with the track bounds using the fast method.
-        if car.check_track_collision(self._track):
-            controller.kill()
             return
 
-        # Checks for checkpoint crossing using fast bounding box pre-rejection.
-        checkpoint_order: int = self._track.check_checkpoint(car.position.x, car.position.y)
+        # Joins the shards back into a single population.
+        for shard, future in self._pending_shards:
 
-        if checkpoint_order >= 0:
-            controller.handle_checkpoint_hit(checkpoint_order, self._num_checkpoints)
+            state, timer = future.result()
+            self._population.assign(shard, state)
+            self._generation_timer = max(self._generation_timer, timer)
 
-        # Checks for finish line crossing.
-        if car.rect.colliderect(self._track.finish_line):
-            controller.handle_finish_line(self._num_checkpoints)
+        self._pending_shards = []
+        self._alive_count = int(np.count_nonzero(self._population.alive))
+        self._stats_dirty = True
 
     def _print_console_status(self) -> None:
 
@@ -475,29 +855,42 @@ class TrainingLoop:
         Prints current generation status to the console.
         """
 
-        alive_count: int = sum(c.is_alive for c in self._controllers)
-        time_remaining: float = max(0.0, TRAINING.MAX_GENERATION_TIME - self._generation_timer)
-
-        if not self._controllers:
+        if not self._genomes:
             return
 
-        fitness_values: list[float] = [c.fitness for c in self._controllers]
-        best_fitness: float = max(fitness_values)
-        avg_fitness: float = sum(fitness_values) / len(fitness_values)
+        self._update_stats()
 
-        best_controller: AIController = max(self._controllers, key=lambda c: c.fitness)
-        best_car: Car = best_controller.car
+        population: PopulationState = self._population
+        time_remaining: float = max(0.0, TRAINING.MAX_GENERATION_TIME - self._generation_timer)
 
         print(
             f"  [{self._generation_timer:.1f}s] "
-            f"Alive: {alive_count:2d}/{TRAINING.POPULATION_SIZE} | "
-            f"Best: {best_fitness:7.0f} | "
-            f"Avg: {avg_fitness:7.0f} | "
-            f"CP: {best_car.current_checkpoint}/{self._num_checkpoints} | "
-            f"Laps: {best_car.laps_completed} | "
+            f"Alive: {self._alive_count:2d}/{TRAINING.POPULATION_SIZE} | "
+            f"Best: {self._best_fitness:7.0f} | "
+            f"Avg: {self._avg_fitness:7.0f} | "
+            f"CP: {population.checkpoint_idx[self._best_idx]}/{self._num_checkpoints} | "
+            f"Laps: {population.laps[self._best_idx]} | "
             f"Time left: {time_remaining:.1f}s"
         )
 
+    def _print_shard_status(self, shards_done: int, now: float) -> None:
+
+        """
+        Prints the progress of a generation being evaluated by the workers.
+
+        Parameters
+        ----------
+        shards_done : int
+            How many of the pending shards have finished.
+        now : float
+            The current time, from ``time.perf_counter()``.
+        """
+
+        print(
+            f"  [{now - self._shards_submitted_time:.1f}s elapsed] "
+            f"Shards done: {shards_done}/{len(self._pending_shards)}"
+        )
+
     def _draw_minimal_gui(self) -> None:
 
         """
@@ -542,17 +935,10 @@ class TrainingLoop:
         self._track.draw(self._screen)
 
         # Draws cars with colour coding.
-        if self._controllers:
+        self._update_stats()
 
-            fitness_values: list[float] = [c.fitness for c in self._controllers]
-            best_fitness: float = max(fitness_values)
-            worst_fitness: float = min(fitness_values)
-
-            for controller in self._controllers:
-
-                is_best: bool = (controller.fitness == best_fitness)
-                is_worst: bool = (controller.fitness == worst_fitness) and not is_best
-                controller.draw(self._screen, is_best, is_worst)
+        if self._genomes:
+            self._population.draw(self._screen, self._best_idx, self._worst_idx)
 
         # Draws stats overlay.
         self._draw_visual_stats_overlay()
@@ -575,69 +961,57 @@ class TrainingLoop:
         the best fitness, average fitness, and best car's progress.
         """
 
-        alive_count: int = sum(c.is_alive for c in self._controllers)
-        time_remaining: float = max(0.0, TRAINING.MAX_GENERATION_TIME - self._generation_timer)
+        self._update_stats()
 
-        if self._controllers:
+        population: PopulationState = self._population
+        alive_count: int = self._alive_count
+        time_remaining: float = max(0.0, TRAINING.MAX_GENERATION_TIME - self._generation_timer)
 
-            fitness_values: list[float] = [c.fitness for c in self._controllers]
-            best_fitness: float = max(fitness_values)
-            avg_fitness: float = sum(fitness_values) / len(fitness_values)
+        if self._genomes:
 
-            best_controller: AIController = max(self._controllers, key=lambda c: c.fitness)
-            best_car: Car | None = best_controller.car
+            best_fitness: float = self._best_fitness
+            avg_fitness: float = self._avg_fitness
+            best_idx: int | None = self._best_idx
 
         else:
 
             best_fitness = avg_fitness = 0
-            best_car = None
+            best_idx = None
+
+        values: list[str] = [
+            f"{self.genetic_algorithm.generation}",
+            f"{alive_count}/{TRAINING.POPULATION_SIZE}",
+            f"{time_remaining:.1f}s / {TRAINING.MAX_GENERATION_TIME:.0f}s",
+            f"{best_fitness:.0f}",
+            f"{avg_fitness:.0f}"
+        ]
 
-        # Semi-transparent background.
-        overlay = pygame.Surface((350, 160))
-        overlay.set_alpha(200)
-        overlay.fill(COLOURS.ITEM_UNSELECTED)
-        self._screen.blit(overlay, (10, 10))
+        if best_idx is not None:
+            values.append(
+                f"{population.checkpoint_idx[best_idx]}/{self._num_checkpoints} | "
+                f"Laps: {population.laps[best_idx]}"
+            )
 
-        # Stats.
-        y = 20
-        draw_outlined_text(
-            self._screen, f"Generation: {self.genetic_algorithm.generation}",
-            (20, y), align="left", font_size=FONTS.SIZE_NORMAL
-        )
+        # Semi-transparent background.
+        self._screen.blit(self._overlay_background, (10, 10))
 
-        y += 25
-        draw_outlined_text(
-            self._screen, f"Alive: {alive_count}/{TRAINING.POPULATION_SIZE}",
-            (20, y), align="left", font_size=FONTS.SIZE_NORMAL
-        )
+        # Stats, offset by the outline padding of the pre-rendered text.
+        y: int = 20 - _OVERLAY_OUTLINE
 
-        y += 25
-        draw_outlined_text(
-            self._screen, f"Time: {time_remaining:.1f}s / {TRAINING.MAX_GENERATION_TIME:.0f}s",
-            (20, y), align="left", font_size=FONTS.SIZE_NORMAL
-        )
+        for row, value in enumerate(values):
 
-        y += 25
-        draw_outlined_text(
-            self._screen, f"Best Fitness: {best_fitness:.0f}",
-            (20, y), align="left", font_size=FONTS.SIZE_NORMAL
-        )
+            label: Surface = self._overlay_labels[row]
+            self._screen.blit(label, (20 - _OVERLAY_OUTLINE, y))
 
-        y += 25
-        draw_outlined_text(
-            self._screen, f"Avg Fitness: {avg_fitness:.0f}",
-            (20, y), align="left", font_size=FONTS.SIZE_NORMAL
-        )
+            # Only re-renders a value when its text has changed.
+            cached_text, value_surface = self._overlay_values[row]
 
-        if best_car:
+            if cached_text != value:
+                value_surface = render_outlined_text(value, font_size=FONTS.SIZE_NORMAL)
+                self._overlay_values[row] = (value, value_surface)
 
+            self._screen.blit(value_surface, (20 + label.get_width() - 3 * _OVERLAY_OUTLINE, y))
             y += 25
-            draw_outlined_text(
-                self._screen,
-                f"Best CP: {best_car.current_checkpoint}/{self._num_checkpoints} | "
-                f"Laps: {best_car.laps_completed}",
-                (20, y), align="left", font_size=FONTS.SIZE_NORMAL
-            )
 
     def _is_generation_complete(self) -> bool:
 
@@ -655,7 +1029,7 @@ class TrainingLoop:
         maximum generation time has been reached.
         """
 
-        all_dead: bool = all(not c.is_alive for c in self._controllers)
+        all_dead: bool = (self._alive_count == 0)
         time_up: bool = self._generation_timer >= TRAINING.MAX_GENERATION_TIME
 
         return all_dead or time_up
@@ -671,26 +1045,22 @@ class TrainingLoop:
         saves the best genomes, and creates the next generation.
         """
 
-        genome_to_controller: dict[int, AIController] = {id(c.genome): c for c in self._controllers}
-
-        def fitness_func(g: Genome) -> float:
-
-            c = genome_to_controller.get(id(g))
-            return c.fitness if c else 0.0
+        population: PopulationState = self._population
 
         # Evolves the population.
-        self.genetic_algorithm.next_generation(fitness_func)
+        # Cars are created in population order, so their fitness is passed as is.
+        self.genetic_algorithm.next_generation(population.fitness.tolist())
 
         # Calculates statistics.
-        fitness_values: list[float] = [c.fitness for c in self._controllers]
-        avg_fitness: float = sum(fitness_values) / len(fitness_values)
-        max_fitness: float = max(fitness_values)
-        min_fitness: float = min(fitness_values)
+        self._update_stats()
+
+        avg_fitness: float = self._avg_fitness
+        max_fitness: float = self._best_fitness
+        min_fitness: float = self._worst_fitness
 
         self._total_generations += 1
 
-        best_controller: AIController = max(self._controllers, key=lambda c: c.fitness)
-        best_car: Car = best_controller.car
+        best_idx: int = self._best_idx
 
         gen_num: int = self.genetic_algorithm.generation - 1
 
@@ -701,18 +1071,19 @@ class TrainingLoop:
         print(f"  Average Fitness:  {avg_fitness:10.2f}")
         print(f"  Best Fitness:     {max_fitness:10.2f}")
         print(f"  Worst Fitness:    {min_fitness:10.2f}")
-        print(f"  Best Checkpoints: {best_car.current_checkpoint}/{self._num_checkpoints}")
-        print(f"  Best Laps:        {best_car.laps_completed}")
+        print(f"  Best Checkpoints: {population.checkpoint_idx[best_idx]}/{self._num_checkpoints}")
+        print(f"  Best Laps:        {population.laps[best_idx]}")
         print(f"  Generation Time:  {self._generation_timer:.2f}s")
 
         # Periodic autosave.
         if gen_num % self._save_interval == 0 and gen_num > 0:
 
-            GenomeIO.save_best_genomes(
-                self.genetic_algorithm,
-                num_best=TRAINING.SAVE_AMOUNT,
-                directory='./data/genomes'
-            )
+            # Copies the genomes, as they are written in the background.
+            best_genomes: list[Genome] = [
+                genome.copy() for genome in self.genetic_algorithm.get_top(TRAINING.SAVE_AMOUNT)
+            ]
+
+            self._save_queue.put((best_genomes, gen_num))
 
             print(f"  Autosaved top 3 genomes for generation {gen_num}.")
 
@@ -721,9 +1092,27 @@ class TrainingLoop:
         # Sends the generation data to the plot.
         self._send_plot_data()
 
+        # Remembers how every simulated car performed.
+        self._cache_evaluated_cars()
+
         # Creates a new generation.
         self._create_generation()
 
+    def _save_worker(self) -> None:
+
+        """
+        Saves queued genomes until it receives ``None``.
+
+        Notes
+        -----
+        Runs on a background thread, so the main loop never waits on disk.
+        """
+
+        while (item := self._save_queue.get()) is not None:
+
+            genomes, generation = item
+            GenomeIO.save_genomes(genomes, generation, directory=str(self._save_dir))
+
     def _print_final_stats(self) -> None:
 
         """
@@ -2,7 +2,7 @@ import pygame
 
 from pygame import Color, Rect, Surface
 from config import COLOURS
-from src.core.utils import draw_outlined_text
+from src.core.utils import draw_outlined_text, set_system_cursor
 
 
 class Button:
@@ -19,7 +19,10 @@ class Button:
         self.is_hovered: bool = False
         self.disabled: bool = disabled
 
-    def draw(self, screen: Surface) -> None:
+        # Caches the rendered button for each text, hover state, disabled state and size.
+        self._surfaces: dict[tuple[str, bool, bool, tuple[int, int]], Surface] = {}
+
+    def draw(self, screen: Surface) -> Rect:
 
         """
         Draws the button on the screen.
@@ -28,32 +31,57 @@ class Button:
         ----------
         screen
             The screen to draw the button on.
+
+        Returns
+        -------
+        Rect
+            The area of the screen the button was drawn over.
+
+        Notes
+        -----
+        Buttons are only rendered the first time they are drawn with a given
+        look, and blitted from the cache afterwards.
         """
 
-        self.colour = COLOURS.BUTTON_HOVERED if self.is_hovered and not self.disabled else COLOURS.BUTTON
+        hovered: bool = self.is_hovered and not self.disabled
+        self.colour = COLOURS.BUTTON_HOVERED if hovered else COLOURS.BUTTON
 
-        if self.disabled:
+        key: tuple[str, bool, bool, tuple[int, int]] = (self.text, hovered, self.disabled, self.rect.size)
+        surface: Surface | None = self._surfaces.get(key)
 
-            # Creates a temporary surface with per-pixel alpha.
-            temp_surface: Surface = Surface(self.rect.size, pygame.SRCALPHA)
+        if surface is None:
+            surface = self._render()
+            self._surfaces[key] = surface
 
-            # Draws the button components on the temporary surface.
-            pygame.draw.rect(temp_surface, self.colour, temp_surface.get_rect(), border_radius=5)
-            pygame.draw.rect(temp_surface, COLOURS.BUTTON_BORDER, temp_surface.get_rect(), 2, border_radius=5)
+        return screen.blit(surface, self.rect.topleft)
 
-            # Draw the text.
-            draw_outlined_text(temp_surface, self.text, temp_surface.get_rect().center)
+    def _render(self) -> Surface:
 
-            # Sets opacity to 50% and draws to the screen.
-            temp_surface.set_alpha(COLOURS.BUTTON_DISABLED_ALPHA)
-            screen.blit(temp_surface, self.rect.topleft)
+        """
+        Renders the button in its current state.
 
-        else:
+        Returns
+        -------
+        Surface
+            The rendered button, the same size as its rectangle.
+        """
+
+        # Creates a surface with per-pixel alpha, so the rounded corners stay transparent.
+        # Matches the display's pixel format, so the button is blitted without converting it each time.
+        surface: Surface = Surface(self.rect.size, pygame.SRCALPHA).convert_alpha()
+
+        # Draws the button components on the surface.
+        pygame.draw.rect(surface, self.colour, surface.get_rect(), border_radius=5)
+        pygame.draw.rect(surface, COLOURS.BUTTON_BORDER, surface.get_rect(), 2, border_radius=5)
+
+        # Draws the text.
+        draw_outlined_text(surface, self.text, surface.get_rect().center)
+
+        # Sets opacity to 50% if disabled.
+        if self.disabled:
+            surface.set_alpha(COLOURS.BUTTON_DISABLED_ALPHA)
 
-            # Draws a regular button.
-            pygame.draw.rect(screen, self.colour, self.rect, border_radius=5)
-            pygame.draw.rect(screen, COLOURS.BUTTON_BORDER, self.rect, 2, border_radius=5)
-            draw_outlined_text(screen, self.text, self.rect.center)
+        return surface
 
     def handle_event(self, event: pygame.event.Event) -> bool:
 
@@ -81,9 +109,9 @@ class Button:
 
             # Updates the cursor based on hover state.
             if self.is_hovered and not was_hovered:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
+                set_system_cursor(pygame.SYSTEM_CURSOR_HAND)
             elif not self.is_hovered and was_hovered:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+                set_system_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.is_hovered:
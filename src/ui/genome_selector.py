@@ -1,15 +1,22 @@
+import os
 import pygame
 import random
 
 from config import COLOURS, FONTS, GAME
 from pathlib import Path
-from pygame import Color, Surface
+from pygame import Color, Rect, Surface
 from pygame.time import Clock
-from src.core.utils import draw_outlined_text
+from src.core.utils import draw_outlined_text, get_pending_events, init_pygame, set_system_cursor
 from .button import Button
 from .list_item import ListItem
 
 
+# The events the genome selector responds to.
+_EVENTS: tuple[int, ...] = (
+    pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEWHEEL, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED
+)
+
+
 class GenomeSelector:
 
     """
@@ -23,31 +30,68 @@ class GenomeSelector:
 
     MAX_SELECTIONS: int = 5
 
+    # The genome files last found in each directory, with the directory's modification time at the time.
+    _listings: dict[Path, tuple[float, list[str]]] = {}
+
     def __init__(self, genomes_directory: str = './data/genomes') -> None:
 
-        pygame.init()
+        init_pygame()
 
         self._screen: Surface = pygame.display.set_mode((GAME.SCREEN_WIDTH, GAME.SCREEN_HEIGHT))
         self._clock: Clock = Clock()
         self._running: bool = True
+        self._dirty: bool = True
         self._selected_genomes: list[str] = []
 
+        # Maps each selected genome to its position in the selection, starting at 1.
+        self._selection_order: dict[str, int] = {}
+
+        # The parts of the screen drawn this frame that can change, so only they are sent to the display.
+        self._dirty_rects: list[Rect] = []
+        self._full_update: bool = True
+        self._status_rect: Rect = Rect(0, 0, 0, 0)
+
         pygame.display.set_caption("NEAT-ish Racing - Select Opponents")
 
         # Resets the cursor.
-        pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        set_system_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
         # Loads available genome files.
         self._genomes_directory: Path = Path(genomes_directory)
         self._available_genomes: list[str] = self._load_available_genomes()
 
+        # The name shown for each genome, worked out once rather than on every scroll.
+        self._genome_names: list[str] = [Path(path).stem for path in self._available_genomes]
+
         # Scrolling state.
         self._scroll_offset: int = 0
-        self._last_scroll_offset: int = 0
         self._max_visible_items: int = 8
         self._item_height: int = 40
         self._list_start_y: int = 180
-        self._genome_items: list[ListItem] = []
+
+        # The area covered by the list and its scroll indicators.
+        self._list_rect: Rect = Rect(
+            GAME.SCREEN_WIDTH // 2 - 300,
+            self._list_start_y - 40,
+            600,
+            self._max_visible_items * self._item_height + 80
+        )
+
+        # Creates one list item per visible row, which are reused as the list scrolls.
+        item_width: int = 600
+        item_position: int = GAME.SCREEN_WIDTH // 2 - item_width // 2
+
+        self._genome_items: list[ListItem] = [
+            ListItem(item_position, self._list_start_y + (i * self._item_height), item_width, self._item_height - 4, "")
+            for i in range(min(self._max_visible_items, len(self._available_genomes)))
+        ]
+        self._refresh_genome_items()
+
+        # The list item under the mouse, if any.
+        self._hovered_item: ListItem | None = None
+
+        # Everything that never changes, drawn once rather than every frame.
+        self._background: Surface = self._render_background()
 
         button_width: int = 100
         button_height: int = 40
@@ -103,10 +147,26 @@ class GenomeSelector:
         if not self._genomes_directory.exists():
             return []
 
-        genome_files: list[Path] = list(self._genomes_directory.glob('*.pkl'))
-        genome_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        # Reuses the last listing if no genome was added, removed or saved since.
+        directory_mtime: float = self._genomes_directory.stat().st_mtime
+        listing: tuple[float, list[str]] | None = GenomeSelector._listings.get(self._genomes_directory)
 
-        return [str(path) for path in genome_files]
+        if listing is not None and listing[0] == directory_mtime:
+            return listing[1]
+
+        # Reads each file's modification time while listing the directory, then sorts by it, newest first.
+        with os.scandir(self._genomes_directory) as entries:
+            genome_files: list[tuple[float, str]] = [
+                (entry.stat().st_mtime, entry.path) for entry in entries
+                if entry.name.endswith('.pkl') and entry.is_file()
+            ]
+
+        genome_files.sort(reverse=True)
+
+        genome_paths: list[str] = [path for _, path in genome_files]
+        GenomeSelector._listings[self._genomes_directory] = (directory_mtime, genome_paths)
+
+        return genome_paths
 
     def run(self) -> list[str] | None:
 
@@ -119,23 +179,49 @@ class GenomeSelector:
             A list of selected genome paths, or None if cancelled.
         """
 
-        while self._running:
+        # Has SDL drop every event the screen ignores, instead of queueing it.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_EVENTS)
+
+        try:
+
+            event: pygame.event.Event = pygame.event.Event(pygame.NOEVENT)
+
+            while self._running:
 
-            result: list[str] | str | None = self._process_events()
+                result: list[str] | str | None = self._process_events(event)
 
-            if result is not None:
-                return result
+                if result is not None:
+                    return result
 
-            self._draw()
-            self._clock.tick(GAME.FPS)
+                # Only redraws the screen when an event changed it.
+                if self._dirty:
+                    self._draw()
+                    self._dirty = False
+
+                self._clock.tick(GAME.FPS)
+
+                # Sleeps until the next event arrives, as the screen only changes in response to one.
+                event = pygame.event.wait(GAME.IDLE_TIMEOUT)
+
+        finally:
+
+            # Lets every event through again for the next screen.
+            pygame.event.set_allowed(None)
 
         return None
 
-    def _process_events(self) -> list[str] | str | None:
+    def _process_events(self, first: pygame.event.Event) -> list[str] | str | None:
 
         """
         Processes all pending Pygame events.
 
+        Parameters
+        ----------
+        first : pygame.event.Event
+            The event the screen woke up for, which comes before the pending
+            ones, or a ``NOEVENT`` if it woke up without one.
+
         Returns
         -------
         list[str] | str | None
@@ -143,12 +229,21 @@ class GenomeSelector:
             'QUIT' to quit.
         """
 
-        # Only updates items if the scroll state changed or items don't exist yet.
-        if self._scroll_offset != self._last_scroll_offset or not self._genome_items:
-            self._update_genome_items()
-            self._last_scroll_offset = self._scroll_offset
+        widgets: list[Button | ListItem] = [
+            self._back_button, self._random_button, self._clear_button, self._start_button, *self._genome_items
+        ]
+        hovered: list[bool] = [widget.is_hovered for widget in widgets]
 
-        for event in pygame.event.get():
+        events: list[pygame.event.Event] = get_pending_events(first)
+
+        # Adds up the scrolling of every wheel event, so the list is only scrolled once.
+        wheel_delta: int = 0
+
+        for event in events:
+
+            # Mouse motion only changes the screen if it changes what is hovered.
+            if event.type != pygame.MOUSEMOTION:
+                self._dirty = True
 
             if event.type == pygame.QUIT:
                 return 'QUIT'
@@ -158,64 +253,93 @@ class GenomeSelector:
                     self._running = False
 
             elif event.type == pygame.MOUSEWHEEL:
-                self._handle_scroll(event.y)
+                wheel_delta += event.y
+
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._full_update = True
 
             if self._back_button.handle_event(event):
                 self._running = False
 
             if self._clear_button.handle_event(event):
-
-                self._selected_genomes.clear()
-
-                for item in self._genome_items:
-                    item.is_selected = False
-                    item.selection_index = None
+                self._set_selection([])
 
             # Handles random selection.
             if self._random_button.handle_event(event):
-
                 self._select_random()
 
-                # Update items after random selection.
-                for item in self._genome_items:
-
-                    if item.data in self._selected_genomes:
-                        item.is_selected = True
-                        item.selection_index = self._selected_genomes.index(item.data) + 1
-                        item.is_selected = False
-                        item.selection_index = None
-
             if self._start_button.handle_event(event):
                 if len(self._selected_genomes) > 0:
                     return self._selected_genomes
 
             # Handles list item clicks.
-            for item in self._genome_items:
+            clicked_item: ListItem | None = self._handle_item_event(event)
 
-                if item.handle_event(event):
-                    genome_path = item.data
+            if clicked_item is not None:
 
-                    # Toggle selections
-                    if genome_path in self._selected_genomes:
-                        self._selected_genomes.remove(genome_path)
-                    elif len(self._selected_genomes) < self.MAX_SELECTIONS:
-                        self._selected_genomes.append(genome_path)
+                genome_path: str = clicked_item.data
 
-                    # Update all items' selection states
-                    for it in self._genome_items:
+                # Toggle selections
+                if genome_path in self._selection_order:
+                    self._set_selection([path for path in self._selected_genomes if path != genome_path])
+                elif len(self._selected_genomes) < self.MAX_SELECTIONS:
+                    self._set_selection(self._selected_genomes + [genome_path])
 
-                        if it.data in self._selected_genomes:
-                            it.is_selected = True
-                            it.selection_index = self._selected_genomes.index(it.data) + 1
+        if wheel_delta:
+            self._handle_scroll(wheel_delta)
 
-                        else:
-                            it.is_selected = False
-                            it.selection_index = None
-
-                    break
+        # Redraws the screen if the mouse moved onto or off a button or item.
+        if [widget.is_hovered for widget in widgets] != hovered:
+            self._dirty = True
 
         return None
 
+    def _handle_item_event(self, event: pygame.event.Event) -> ListItem | None:
+
+        """
+        Passes a mouse event to the list items it can affect.
+
+        Parameters
+        ----------
+        event : pygame.event.Event
+            The pygame event to handle.
+
+        Returns
+        -------
+        ListItem | None
+            The item that was clicked, or ``None`` if no item was.
+
+        Notes
+        -----
+        Only the item in the row under the mouse, and the item the mouse
+        was last over, can respond, so the others are skipped.
+        """
+
+        if event.type not in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+            return None
+
+        # Finds the row under the mouse from its height, rather than testing every item.
+        row: int = (event.pos[1] - self._list_start_y) // self._item_height
+        row_item: ListItem | None = self._genome_items[row] if 0 <= row < len(self._genome_items) else None
+
+        clicked_item: ListItem | None = None
+
+        for item in (self._hovered_item, row_item):
+
+            if item is not None and item.handle_event(event):
+                clicked_item = item
+
+            # Stops early if the mouse is still over the same item.
+            if row_item is self._hovered_item:
+                break
+
+        if row_item is not None and row_item.is_hovered:
+            self._hovered_item = row_item
+        else:
+            self._hovered_item = None
+
+        return clicked_item
+
     def _handle_scroll(self, direction: int) -> None:
 
         """
@@ -228,7 +352,14 @@ class GenomeSelector:
         """
 
         max_scroll: int = max(0, len(self._available_genomes) - self._max_visible_items)
-        self._scroll_offset = max(0, min(max_scroll, self._scroll_offset - direction))
+        scroll_offset: int = max(0, min(max_scroll, self._scroll_offset - direction))
+
+        # Only refreshes items if the list actually scrolled.
+        if scroll_offset != self._scroll_offset:
+
+            self._scroll_offset = scroll_offset
+            self._refresh_genome_items()
+            self._dirty = True
 
     def _select_random(self) -> None:
 
@@ -239,31 +370,79 @@ class GenomeSelector:
         if not self._available_genomes:
             return
 
-        self._selected_genomes.clear()
-
         # Selects up to MAX_SELECTIONS random genomes.
         num_to_select: int = min(self.MAX_SELECTIONS, len(self._available_genomes))
-        self._selected_genomes = random.sample(self._available_genomes, num_to_select)
+        self._set_selection(random.sample(self._available_genomes, num_to_select))
 
-    def _draw(self) -> None:
+    def _set_selection(self, genome_paths: list[str]) -> None:
 
         """
-        Draws the genome selector screen.
+        Replaces the selected genomes and shows them in the list items.
+
+        Parameters
+        ----------
+        genome_paths : list[str]
+            The paths of the selected genomes, in the order they were selected.
+        """
+
+        self._selected_genomes = genome_paths
+        self._selection_order = {path: i + 1 for i, path in enumerate(genome_paths)}
+
+        self._refresh_genome_items()
+
+    def _render_background(self) -> Surface:
+
         """
+        Renders the parts of the genome selector screen that never change.
 
-        # Background.
-        self._screen.fill(COLOURS.BACKGROUND)
+        Returns
+        -------
+        Surface
+            The static part of the screen, the same size as the screen.
+        """
+
+        background: Surface = Surface((GAME.SCREEN_WIDTH, GAME.SCREEN_HEIGHT)).convert()
+        background.fill(COLOURS.BACKGROUND)
 
         # Title.
         draw_outlined_text(
-            self._screen,
+            background,
             "Select Opponents",
             (GAME.SCREEN_WIDTH // 2, 80),
             font_size=FONTS.SIZE_LARGE
         )
 
-        # Selection count.
+        # Instructions.
         draw_outlined_text(
+            background,
+            "Click to select/deselect. Scroll to see more.",
+            (GAME.SCREEN_WIDTH // 2, 580),
+            font_size=FONTS.SIZE_NORMAL,
+            text_colour=COLOURS.TEXT_SECONDARY
+        )
+
+        return background
+
+    def _draw(self) -> None:
+
+        """
+        Draws the genome selector screen.
+        """
+
+        self._dirty_rects.clear()
+
+        # Draws the whole background the first time, and only the parts that can change afterwards.
+        if self._full_update:
+            self._screen.blit(self._background, (0, 0))
+        else:
+            for rect in (
+                self._status_rect, self._list_rect, self._back_button.rect, self._random_button.rect,
+                self._clear_button.rect, self._start_button.rect
+            ):
+                self._screen.blit(self._background, rect, rect)
+
+        # Selection count.
+        status_rect: Rect = draw_outlined_text(
             self._screen,
             f"Selected: {len(self._selected_genomes)}/{self.MAX_SELECTIONS}",
             (GAME.SCREEN_WIDTH // 2, 110),
@@ -271,67 +450,49 @@ class GenomeSelector:
             text_colour=COLOURS.TEXT_SECONDARY
         )
 
+        # Updates the text's whole row, so shorter text covers longer text drawn before it.
+        self._status_rect = Rect(0, status_rect.y, GAME.SCREEN_WIDTH, status_rect.height)
+        self._dirty_rects.append(self._status_rect)
+
         # Draws the genome list.
         self._draw_genome_list()
 
         # Draws scroll indicators if needed.
         self._draw_scroll_indicators()
+        self._dirty_rects.append(self._list_rect)
 
         # Draws buttons.
-        self._back_button.draw(self._screen)
-        self._random_button.draw(self._screen)
-        self._clear_button.draw(self._screen)
+        self._dirty_rects.append(self._back_button.draw(self._screen))
+        self._dirty_rects.append(self._random_button.draw(self._screen))
+        self._dirty_rects.append(self._clear_button.draw(self._screen))
 
         # Only enables start button if at least one genome is selected.
         self._start_button.disabled = not self._selected_genomes
-        self._start_button.draw(self._screen)
-
-        # Instructions.
-        draw_outlined_text(
-            self._screen,
-            "Click to select/deselect. Scroll to see more.",
-            (GAME.SCREEN_WIDTH // 2, 580),
-            font_size=FONTS.SIZE_NORMAL,
-            text_colour=COLOURS.TEXT_SECONDARY
-        )
+        self._dirty_rects.append(self._start_button.draw(self._screen))
 
-        pygame.display.flip()
+        # Updates the whole screen the first time, and only the parts that can change afterwards.
+        if self._full_update:
+            pygame.display.flip()
+            self._full_update = False
+        else:
+            pygame.display.update(self._dirty_rects)
 
-    def _update_genome_items(self) -> None:
+    def _refresh_genome_items(self) -> None:
 
         """
-        Updates the list items based on current scroll position.
+        Shows the genomes at the current scroll position in the list items.
         """
 
-        self._genome_items.clear()
-        visible_start: int = self._scroll_offset
-        visible_end: int = min(visible_start + self._max_visible_items, len(self._available_genomes))
-
-        item_width: int = 600
-        item_position: int = GAME.SCREEN_WIDTH // 2 - item_width // 2
-
-        for i, genome_index in enumerate(range(visible_start, visible_end)):
+        for i, item in enumerate(self._genome_items):
 
-            genome_path: str = self._available_genomes[genome_index]
-            genome_name: str = Path(genome_path).stem
-            y: int = self._list_start_y + (i * self._item_height)
+            genome_path: str = self._available_genomes[self._scroll_offset + i]
 
-            item: ListItem = ListItem(
-                item_position,
-                y,
-                item_width,
-                self._item_height - 4,
-                genome_name,
-                data=genome_path
-            )
+            item.text = self._genome_names[self._scroll_offset + i]
+            item.data = genome_path
 
             # Sets the selection state and index.
-            if genome_path in self._selected_genomes:
-
-                item.is_selected = True
-                item.selection_index = self._selected_genomes.index(genome_path) + 1
-
-            self._genome_items.append(item)
+            item.selection_index = self._selection_order.get(genome_path)
+            item.is_selected = item.selection_index is not None
 
     def _draw_genome_list(self) -> None:
 
@@ -350,8 +511,13 @@ class GenomeSelector:
             )
             return
 
+        item_blits: list[tuple[Surface, tuple[int, int]]] = []
+
         for item in self._genome_items:
-            item.draw(self._screen)
+            item_blits.extend(item.get_blits())
+
+        # Draws every item in a single call.
+        self._screen.blits(item_blits, doreturn=False)
 
     def _draw_scroll_indicators(self) -> None:
 
@@ -1,9 +1,77 @@
 import pygame
 
+from functools import lru_cache
 from typing import Any, Optional
 from pygame import Color, Rect, Surface
 from config import COLOURS, FONTS
-from src.core.utils import draw_outlined_text
+from src.core.utils import clear_on_quit, render_outlined_text, set_system_cursor
+
+
+# The outline thickness of an item's text, which pads each rendered surface.
+_OUTLINE: int = 2
+
+# The background colours of hovered items, lightened once rather than every frame.
+_ITEM_SELECTED_HOVERED: Color = COLOURS.ITEM_SELECTED + Color(20, 20, 20, 0)
+_ITEM_UNSELECTED_HOVERED: Color = COLOURS.ITEM_UNSELECTED + Color(20, 20, 20, 0)
+
+
+@clear_on_quit
+@lru_cache(maxsize=128)
+def _render_item(
+    text: str,
+    indicator_text: str,
+    text_colour: tuple[int, int, int, int],
+    bg_colour: tuple[int, int, int, int],
+    size: tuple[int, int]
+) -> Surface:
+
+    """
+    Renders a whole item, reusing the surface while it is in the cache.
+
+    Parameters
+    ----------
+    text : str
+        The item's text.
+    indicator_text : str
+        The item's selection indicator.
+    text_colour : tuple[int, int, int, int]
+        The text colour, as a tuple so it can be cached.
+    bg_colour : tuple[int, int, int, int]
+        The background colour, as a tuple so it can be cached.
+    size : tuple[int, int]
+        The width and height of the item.
+
+    Returns
+    -------
+    Surface
+        The item, transparent outside its rounded corners.
+
+    Notes
+    -----
+    Items are reused as their list scrolls, so rendered items are cached
+    here by their look rather than on each item.
+    """
+
+    # Matches the display's pixel format, so the item is blitted without converting it each time.
+    surface: Surface = Surface(size, pygame.SRCALPHA).convert_alpha()
+    pygame.draw.rect(surface, bg_colour, surface.get_rect(), border_radius=5)
+
+    # Offsets the text by its outline, which pads the rendered surfaces.
+    colour: Color = Color(text_colour)
+    text_position: int = 15 - _OUTLINE
+    text_y: int = 9 - _OUTLINE
+
+    # Draws the selection indicator, followed by the text.
+    surface.blit(
+        render_outlined_text(indicator_text, colour, outline_thickness=_OUTLINE, font_size=FONTS.SIZE_NORMAL),
+        (text_position, text_y)
+    )
+    surface.blit(
+        render_outlined_text(text, colour, outline_thickness=_OUTLINE, font_size=FONTS.SIZE_NORMAL),
+        (text_position + 50, text_y)
+    )
+
+    return surface
 
 
 class ListItem:
@@ -22,15 +90,16 @@ class ListItem:
         self.is_hovered: bool = False
         self.selection_index: Optional[int] = None
 
-    def draw(self, screen: Surface) -> None:
+    def get_blits(self) -> list[tuple[Surface, tuple[int, int]]]:
 
         """
-        Draws the list item on the screen.
+        Gets the surfaces that make up the list item.
 
-        Parameters
-        ----------
-        screen
-            The screen to draw the list item on.
+        Returns
+        -------
+        list[tuple[Surface, tuple[int, int]]]
+            The item's surface and its position, for the caller to blit
+            together with the rest of the list.
         """
 
         # Determines colors based on selection state.
@@ -46,15 +115,7 @@ class ListItem:
 
         # Lightens the background color when hovered.
         if self.is_hovered and (self.selection_index or not self.is_selected):
-            bg_colour = Color(
-                min(255, bg_colour.r + 20),
-                min(255, bg_colour.g + 20),
-                min(255, bg_colour.b + 20),
-                bg_colour.a
-            )
-
-        # Draws the background.
-        pygame.draw.rect(screen, bg_colour, self.rect, border_radius=5)
+            bg_colour = _ITEM_SELECTED_HOVERED if self.is_selected else _ITEM_UNSELECTED_HOVERED
 
         # Determines indicator text based on selection mode.
         if self.selection_index is not None:
@@ -62,27 +123,11 @@ class ListItem:
         else:
             indicator_text = "[X]" if self.is_selected else "[ ]"
 
-        text_position: int = self.rect.x + 15
-
-        # Draws the selection indicator.
-        draw_outlined_text(
-            screen,
-            indicator_text,
-            (text_position, self.rect.y + 9),
-            align='left',
-            font_size=FONTS.SIZE_NORMAL,
-            text_colour=text_colour
+        item: Surface = _render_item(
+            self.text, indicator_text, tuple(text_colour), tuple(bg_colour), self.rect.size
         )
 
-        # Draws the text.
-        draw_outlined_text(
-            screen,
-            self.text,
-            (text_position + 50, self.rect.y + 9),
-            align='left',
-            font_size=FONTS.SIZE_NORMAL,
-            text_colour=text_colour
-        )
+        return [(item, self.rect.topleft)]
 
     def handle_event(self, event: pygame.event.Event) -> bool:
 
@@ -107,9 +152,9 @@ class ListItem:
 
             # Updates the cursor based on hover state.
             if self.is_hovered and not was_hovered:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
+                set_system_cursor(pygame.SYSTEM_CURSOR_HAND)
             elif not self.is_hovered and was_hovered:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+                set_system_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.is_hovered:
@@ -1,12 +1,18 @@
 import pygame
 
-from pygame import Surface
+from pygame import Rect, Surface
 from pygame.time import Clock
 from config import COLOURS, FONTS, GAME
-from src.core.utils import draw_outlined_text
+from src.core.utils import draw_outlined_text, get_pending_events, init_pygame, set_system_cursor
 from .button import Button
 
 
+# The events the menu responds to.
+_EVENTS: tuple[int, ...] = (
+    pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED
+)
+
+
 class MainMenu:
 
     """
@@ -20,17 +26,22 @@ class MainMenu:
 
     def __init__(self) -> None:
 
-        pygame.init()
+        init_pygame()
 
         self._screen: Surface = pygame.display.set_mode((GAME.SCREEN_WIDTH, GAME.SCREEN_HEIGHT))
         self._clock: Clock = Clock()
         self._running: bool = True
+        self._dirty: bool = True
         self._selected_mode: str | None = None
 
+        # The parts of the screen drawn this frame that can change, so only they are sent to the display.
+        self._dirty_rects: list[Rect] = []
+        self._full_update: bool = True
+
         pygame.display.set_caption("NEAT-ish Racing")
 
         # Resets the cursor.
-        pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        set_system_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
         # Creates the menu buttons.
         button_width: int = 150
@@ -61,6 +72,11 @@ class MainMenu:
             text="Quit"
         )
 
+        self._buttons: tuple[Button, ...] = (self._train_button, self._play_button, self._quit_button)
+
+        # Renders the parts of the menu that never change.
+        self._background: Surface = self._render_background()
+
     def run(self) -> str | None:
 
         """
@@ -72,25 +88,59 @@ class MainMenu:
             The selected mode ('train', 'play', 'QUIT'), or None if the menu was closed.
         """
 
-        while self._running:
+        # Has SDL drop every event the screen ignores, instead of queueing it.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_EVENTS)
+
+        try:
+
+            event: pygame.event.Event = pygame.event.Event(pygame.NOEVENT)
+
+            while self._running:
+
+                self._process_events(event)
 
-            self._process_events()
-            self._draw()
+                # Only redraws the screen when an event changed it.
+                if self._dirty:
+                    self._draw()
+                    self._dirty = False
 
-            self._clock.tick(GAME.FPS)
+                self._clock.tick(GAME.FPS)
 
-            if self._selected_mode is not None:
-                break
+                if self._selected_mode is not None:
+                    break
+
+                # Sleeps until the next event arrives, as the screen only changes in response to one.
+                event = pygame.event.wait(GAME.IDLE_TIMEOUT)
+
+        finally:
+
+            # Lets every event through again for the next screen.
+            pygame.event.set_allowed(None)
 
         return self._selected_mode
 
-    def _process_events(self) -> None:
+    def _process_events(self, first: pygame.event.Event) -> None:
 
         """
         Processes all pending Pygame events.
+
+        Parameters
+        ----------
+        first : pygame.event.Event
+            The event the menu woke up for, which comes before the pending
+            ones, or a ``NOEVENT`` if it woke up without one.
         """
 
-        for event in pygame.event.get():
+        hovered: list[bool] = [button.is_hovered for button in self._buttons]
+
+        events: list[pygame.event.Event] = get_pending_events(first)
+
+        for event in events:
+
+            # Mouse motion only changes the screen if it changes what is hovered.
+            if event.type != pygame.MOUSEMOTION:
+                self._dirty = True
 
             if event.type == pygame.QUIT:
                 self._running = False
@@ -101,6 +151,9 @@ class MainMenu:
                     self._running = False
                     self._selected_mode = 'QUIT'
 
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._full_update = True
+
             if self._train_button.handle_event(event):
                 self._selected_mode = 'train'
 
@@ -111,18 +164,27 @@ class MainMenu:
                 self._running = False
                 self._selected_mode = 'QUIT'
 
-    def _draw(self) -> None:
+        # Redraws the screen if the mouse moved onto or off a button.
+        if [button.is_hovered for button in self._buttons] != hovered:
+            self._dirty = True
+
+    def _render_background(self) -> Surface:
 
         """
-        Draws the menu screen.
+        Renders everything on the menu screen except its buttons.
+
+        Returns
+        -------
+        Surface
+            The static part of the menu, the same size as the screen.
         """
 
-        # Background.
-        self._screen.fill(COLOURS.BACKGROUND)
+        background: Surface = Surface((GAME.SCREEN_WIDTH, GAME.SCREEN_HEIGHT)).convert()
+        background.fill(COLOURS.BACKGROUND)
 
         # Title.
         draw_outlined_text(
-            self._screen,
+            background,
             "NEAT-ish Racing",
             (GAME.SCREEN_WIDTH // 2, 150),
             font_size=FONTS.SIZE_XL
@@ -130,25 +192,45 @@ class MainMenu:
 
         # Subtitle.
         draw_outlined_text(
-            self._screen,
+            background,
             "A Neuroevolution Racing Game",
             (GAME.SCREEN_WIDTH // 2, 190),
             font_size=FONTS.SIZE_LARGE,
             text_colour=COLOURS.TEXT_SECONDARY
         )
 
-        # Buttons.
-        self._train_button.draw(self._screen)
-        self._play_button.draw(self._screen)
-        self._quit_button.draw(self._screen)
-
         # Footer.
         draw_outlined_text(
-            self._screen,
+            background,
             "Press ESC to quit",
             (GAME.SCREEN_WIDTH // 2, 600),
             font_size=FONTS.SIZE_NORMAL,
             text_colour=COLOURS.TEXT_SECONDARY
         )
 
-        pygame.display.flip()
+        return background
+
+    def _draw(self) -> None:
+
+        """
+        Draws the menu screen.
+        """
+
+        self._dirty_rects.clear()
+
+        # Draws the whole background the first time, as only the buttons change afterwards.
+        if self._full_update:
+            self._screen.blit(self._background, (0, 0))
+
+        # Buttons, each over a fresh copy of the background behind it.
+        for button in self._buttons:
+
+            self._screen.blit(self._background, button.rect, button.rect)
+            self._dirty_rects.append(button.draw(self._screen))
+
+        # Updates the whole screen the first time, and only the parts that can change afterwards.
+        if self._full_update:
+            pygame.display.flip()
+            self._full_update = False
+        else:
+            pygame.display.update(self._dirty_rects)
@@ -1,276 +1,567 @@
 import multiprocessing as mp
+import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
 
 from typing import Any
 from queue import Empty
 from matplotlib.backend_bases import Event, MouseEvent
+from matplotlib.collections import QuadMesh
 from matplotlib.colorbar import Colorbar
+from matplotlib.container import BarContainer
 from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.text import Text
+from matplotlib.ticker import AutoLocator, MaxNLocator
 from matplotlib.transforms import Bbox
+from multiprocessing.shared_memory import SharedMemory
 from numpy.typing import NDArray
-
-
-def plotting_process(queue: mp.Queue):
+from config import TRAINING
+
+
+# A dark version of seaborn's darkgrid theme, applied directly so seaborn does not have to be imported.
+_THEME: dict[str, Any] = {
+    "axes.axisbelow": True,
+    "axes.edgecolor": "white",
+    "axes.facecolor": "#1a1a1a",
+    "axes.grid": True,
+    "axes.labelcolor": "white",
+    "axes.labelsize": 12.0,
+    "axes.linewidth": 1.25,
+    "axes.titlesize": 12.0,
+    "figure.facecolor": "#121212",
+    "font.sans-serif": ["Arial", "DejaVu Sans", "Liberation Sans", "Bitstream Vera Sans", "sans-serif"],
+    "font.size": 12.0,
+    "grid.color": "#333333",
+    "grid.linewidth": 1.0,
+    "legend.fontsize": 11.0,
+    "legend.title_fontsize": 12.0,
+    "lines.solid_capstyle": "round",
+    "patch.edgecolor": "white",
+    "patch.force_edgecolor": True,
+    "text.color": "white",
+    "xtick.bottom": False,
+    "xtick.color": "white",
+    "xtick.labelsize": 11.0,
+    "xtick.major.size": 6.0,
+    "xtick.major.width": 1.25,
+    "xtick.minor.size": 4.0,
+    "xtick.minor.width": 1.0,
+    "ytick.color": "white",
+    "ytick.labelsize": 11.0,
+    "ytick.left": False,
+    "ytick.major.size": 6.0,
+    "ytick.major.width": 1.25,
+    "ytick.minor.size": 4.0,
+    "ytick.minor.width": 1.0
+}
+
+# The number of bins of the fitness and survival time histograms, so their bars can be reused.
+_HISTOGRAM_BINS: int = 20
+
+# The number of points each density curve is sampled at.
+_KDE_POINTS: int = 200
+
+# The size of each cell of the death heatmap, in pixels.
+_HEATMAP_BIN_SIZE: int = 20
+
+# Where a zoomed subplot and the heatmap's colour bar are placed, as left, bottom, width and height.
+_ZOOMED_POSITION: tuple[float, float, float, float] = (0.1, 0.1, 0.8, 0.8)
+_ZOOMED_COLOUR_BAR_POSITION: tuple[float, float, float, float] = (0.87, 0.1, 0.03, 0.8)
+
+
+def plotting_process(queue: mp.Queue, track_bg_name: str, track_bg_shape: tuple[int, ...]):
 
     """
     Runs in a separate process, receives data via queue.
+    The track background is read from the shared memory block with the given name and shape.
     """
 
-    sns.set_theme(style="darkgrid", rc={
-        "axes.facecolor": "#1a1a1a",
-        "figure.facecolor": "#121212",
-        "text.color": "white",
-        "axes.labelcolor": "white",
-        "xtick.color": "white",
-        "ytick.color": "white",
-        "grid.color": "#333333"
-    })
+    plt.rcParams.update(_THEME)
 
     # Turns on the interactive mode.
     plt.ion()
-    fig, axes = plt.subplots(2, 3, figsize=(14, 8))
 
-    # Track background (received with first data packet).
-    track_img: NDArray | None = None
+    # Track background, attached read-only from shared memory.
+    track_bg: SharedMemory = SharedMemory(name=track_bg_name)
+    track_img: NDArray[np.uint8] = np.ndarray(track_bg_shape, dtype=np.uint8, buffer=track_bg.buf)
+    track_img.flags.writeable = False
 
-    # Colour bar reference for cleanup.
-    heatmap_cbar: Colorbar | None = None
+    plots: _TrainingPlots = _TrainingPlots(track_img)
 
-    # Stores the original positions to restore the grid view.
-    original_positions: dict[Axes, Bbox] = {ax: ax.get_position() for ax in axes.flat}
-    zoomed_ax: Axes | None = None
+    while True:
 
-    def on_click(event: Event) -> None:
+        # Checks for new data.
+        try:
+            data: dict[str, Any] = queue.get(timeout=0.1)
+        except Empty:
+            plots.fig.canvas.flush_events()
+            continue
 
-        if not isinstance(event, MouseEvent):
-            return None
+        # Takes every packet already queued, so a backlog is drawn once rather than packet by packet.
+        while data is not None:
 
-        nonlocal zoomed_ax
+            plots.add(data)
 
-        if event.inaxes is None:
-            return None
+            try:
+                data = queue.get_nowait()
+            except Empty:
+                break
 
-        # If the view is already zoomed, restores the grid view.
-        if zoomed_ax is not None:
+        # Shutdown.
+        if data is None:
+            plt.close()
+            break
 
-            for ax in axes.flat:
-                ax.set_visible(True)
-                ax.set_position(original_positions[ax])
+        plots.draw()
 
-            zoomed_ax = None
-            fig.canvas.draw_idle()
-            return None
 
-        # Zooms into clicked subplot.
-        clicked_ax: Axes = event.inaxes
-        if clicked_ax in axes.flat:
+class _TrainingPlots:
 
-            for ax in axes.flat:
-                if ax != clicked_ax:
-                    ax.set_visible(False)
+    """
+    The graph window, whose artists are created once and updated in place
+    with each packet from the training loop.
+
+    Methods
+    -------
+    add(data: dict[str, Any]) -> None
+        Takes in a packet from the training loop.
+    draw() -> None
+        Updates every plot with the packets taken in so far.
+    """
 
-            clicked_ax.set_position((0.1, 0.1, 0.8, 0.8))
-            zoomed_ax = clicked_ax
-            fig.canvas.draw_idle()
+    def __init__(self, track_img: NDArray[np.uint8]) -> None:
 
-        return None
+        self.fig: Figure
+        self._axes: NDArray
+        self.fig, self._axes = plt.subplots(2, 3, figsize=(14, 8))
 
-    # Links the defined function to matplotlib's click event.
-    fig.canvas.mpl_connect('button_press_event', on_click)
+        # History received so far, as each packet only holds what is new.
+        self._latest: dict[str, Any] | None = None
+        # Each row holds a generation, and its best, average and worst fitness.
+        self._history: NDArray[np.float32] = np.zeros((0, 4), dtype=np.float32)
 
-    while True:
+        self._title: Text = self.fig.suptitle("Training Progress")
 
-        # Checks for new data.
-        try:
-            data: dict[str, Any] = queue.get(timeout=0.1)
-        except Empty:
-            fig.canvas.flush_events()
-            continue
+        # Fitness over time.
+        fitness_ax: Axes = self._axes[0, 0]
+        self._best_line: Line2D = fitness_ax.plot([], [], label='Best', color='mediumseagreen')[0]
+        self._avg_line: Line2D = fitness_ax.plot([], [], label='Average', color='deepskyblue')[0]
+        self._worst_line: Line2D = fitness_ax.plot([], [], label='Worst', color='tomato')[0]
+        fitness_ax.set_title("Fitness Over Generations")
+        fitness_ax.set_xlabel("Generation")
+        fitness_ax.set_ylabel("Fitness")
+        fitness_ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+        fitness_ax.legend()
+
+        # Histograms, whose bars are only rebuilt when their number changes.
+        self._bars: dict[Axes, BarContainer] = {}
+        self._colours: dict[Axes, str] = {
+            self._axes[0, 1]: 'mediumpurple',
+            self._axes[0, 2]: 'darkorange',
+            self._axes[1, 0]: 'teal',
+            self._axes[1, 1]: 'coral'
+        }
+
+        for ax, xlabel in (
+            (self._axes[0, 1], "Fitness"),
+            (self._axes[0, 2], "Checkpoint"),
+            (self._axes[1, 0], "Laps"),
+            (self._axes[1, 1], "Time (s)")
+        ):
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel("Count")
+
+        # Density curves over the continuous histograms.
+        self._kde_lines: dict[Axes, Line2D] = {
+            ax: ax.plot([], [], color=self._colours[ax])[0] for ax in (self._axes[0, 1], self._axes[1, 1])
+        }
+
+        # Messages shown instead of the discrete histograms when they would be empty.
+        self._messages: dict[Axes, Text] = {
+            ax: ax.text(
+                0.5, 0.5, message,
+                ha="center", va="center", fontsize=12, color="white",
+                transform=ax.transAxes, visible=False
+            )
+            for ax, message in (
+                (self._axes[0, 2], "No car has crossed a checkpoint."),
+                (self._axes[1, 0], "No car has completed a lap.")
+            )
+        }
+
+        # Death position heatmap with track overlay, whose counts are accumulated as crashes arrive.
+        heatmap_ax: Axes = self._axes[1, 2]
+        track_height, track_width = track_img.shape[:2]
+        heatmap_ax.imshow(track_img, extent=[0, track_width, track_height, 0], aspect='equal')
+
+        self._death_count: int = 0
+        self._heatmap_size: NDArray[np.float64] = np.array([track_width, track_height], dtype=np.float64)
+        self._heatmap_bins: NDArray[np.int64] = (self._heatmap_size / _HEATMAP_BIN_SIZE).astype(np.int64)
+        self._heatmap: NDArray[np.float64] = np.zeros(self._heatmap_bins)
+
+        x_edges: NDArray[np.float64] = np.linspace(0, track_width, self._heatmap_bins[0] + 1)
+        y_edges: NDArray[np.float64] = np.linspace(0, track_height, self._heatmap_bins[1] + 1)
+        self._heatmap_mesh: QuadMesh = heatmap_ax.pcolormesh(
+            x_edges, y_edges, self._heatmap.T, cmap='Reds', alpha=0.4, visible=False
+        )
+
+        self._heatmap_cbar: Colorbar = self.fig.colorbar(self._heatmap_mesh, ax=heatmap_ax)
+        self._heatmap_cbar.set_label('Deaths')
+
+        heatmap_ax.set_xlim(0, track_width)
+        heatmap_ax.set_ylim(track_height, 0)
+        heatmap_ax.grid(alpha=0.1)
+        heatmap_ax.set_title("Death Heatmap (All Generations)")
+        heatmap_ax.set_xlabel("X")
+        heatmap_ax.set_ylabel("Y")
 
-        # Shutdown.
-        if data is None:
-            plt.close()
-            break
+        # Lays the grid out once, then stores the positions to restore the grid view.
+        self.fig.tight_layout()
+        self._original_positions: dict[Axes, Bbox] = {
+            ax: ax.get_position(original=True) for ax in (*self._axes.flat, self._heatmap_cbar.ax)
+        }
+        self._zoomed_ax: Axes | None = None
 
-        # Stores track background if included.
-        if 'track_bg' in data:
-            track_img = data['track_bg']
+        # Links the click handler to matplotlib's click event.
+        self.fig.canvas.mpl_connect('button_press_event', self._on_click)
 
-        # Extracts history and current gen data.
-        generations: list = data['generations']
-        best_fitness: list = data['best_fitness']
-        avg_fitness: list = data['avg_fitness']
-        worst_fitness: list = data['worst_fitness']
-        current_gen: int = data['current_gen']
+    def add(self, data: dict[str, Any]) -> None:
 
-        # Updates title with current generation.
-        fig.suptitle(f"Training Progress — Generation {current_gen}")
+        """
+        Takes in a packet from the training loop.
 
-        # Removes old colour bar.
-        if heatmap_cbar is not None:
-            heatmap_cbar.remove()
-            heatmap_cbar = None
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The packet, holding the new history and crashes, and the stats of
+            the current generation.
 
-        # Clears and redraws.
-        for ax in axes.flat:
-            ax.clear()
+        Notes
+        -----
+        The history and crashes of every packet are kept, as each one only
+        holds what is new, but only the latest generation's stats are drawn.
+        """
 
-        # Restores zoom state after clearing.
-        if zoomed_ax is not None:
-            for ax in axes.flat:
-                if ax != zoomed_ax:
-                    ax.set_visible(False)
-                else:
-                    ax.set_position((0.1, 0.1, 0.8, 0.8))
+        # Adds the new history, keeping as many generations as the training loop does.
+        self._history = np.concatenate((self._history, data['history']))[-TRAINING.MAX_HISTORY:]
+
+        # Adds the crashes received in this packet to the death heatmap.
+        deaths: NDArray[np.float32] = data['death_positions']
+
+        if len(deaths) > 0:
+            self._heatmap += _count_uniform(deaths, self._heatmap_size, self._heatmap_bins)
+            self._death_count += len(deaths)
+
+        self._latest = data
+
+    def draw(self) -> None:
+
+        """
+        Updates every plot with the packets taken in so far.
+        """
+
+        data: dict[str, Any] | None = self._latest
+
+        if data is None:
+            return
+
+        # Extracts current gen data.
+        current_gen: int = data['current_gen']
+
+        # Updates title with current generation.
+        self._title.set_text(f"Training Progress — Generation {current_gen}")
 
         # Fitness over time.
-        sns.lineplot(x=generations, y=best_fitness, label='Best', color='mediumseagreen', ax=axes[0, 0])
-        sns.lineplot(x=generations, y=avg_fitness, label='Average', color='deepskyblue', ax=axes[0, 0])
-        sns.lineplot(x=generations, y=worst_fitness, label='Worst', color='tomato', ax=axes[0, 0])
-        axes[0, 0].set_title("Fitness Over Generations")
-        axes[0, 0].set_xlabel("Generation")
-        axes[0, 0].set_ylabel("Fitness")
-        axes[0, 0].xaxis.set_major_locator(plt.MaxNLocator(integer=True))
-        axes[0, 0].legend()
+        generations: NDArray[np.float32] = self._history[:, 0]
+        self._best_line.set_data(generations, self._history[:, 1])
+        self._avg_line.set_data(generations, self._history[:, 2])
+        self._worst_line.set_data(generations, self._history[:, 3])
+        _rescale(self._axes[0, 0])
 
         # Fitness distribution (current generation).
         if 'fitness_distribution' in data:
-
-            sns.histplot(data['fitness_distribution'], ax=axes[0, 1], kde=True, color='mediumpurple')
-            axes[0, 1].set_title(f"Fitness Distribution (Gen {current_gen})")
-            axes[0, 1].set_xlabel("Fitness")
-            axes[0, 1].set_ylabel("Count")
+            self._set_histogram(self._axes[0, 1], np.asarray(data['fitness_distribution'], dtype=np.float64))
+            self._axes[0, 1].set_title(f"Fitness Distribution (Gen {current_gen})")
 
         # Checkpoints reached (current generation, lap 0 only).
         if 'checkpoints' in data and 'laps' in data:
 
-            filtered = [cp for cp, lap in zip(data['checkpoints'], data['laps']) if lap == 0]
+            checkpoints: NDArray[np.int64] = np.asarray(data['checkpoints'], dtype=np.int64)
+            filtered: NDArray[np.int64] = checkpoints[np.asarray(data['laps'], dtype=np.int64) == 0]
 
-            # If everyone has 0 checkpoints, shows a blank message.
-            if len(filtered) == 0 or all(cp == 0 for cp in filtered):
+            self._set_discrete_histogram(self._axes[0, 2], filtered)
+            self._axes[0, 2].set_title(f"Checkpoints Reached (Gen {current_gen}, Lap 0)")
 
-                _draw_empty_message(axes[0, 2], "No car has crossed a checkpoint.")
+        # Laps completed (current generation).
+        if 'laps' in data:
+            self._set_discrete_histogram(self._axes[1, 0], np.asarray(data['laps'], dtype=np.int64))
+            self._axes[1, 0].set_title(f"Laps Completed (Gen {current_gen})")
 
-            else:
+        # Survival times (current generation).
+        if 'survival_times' in data:
+            self._set_histogram(self._axes[1, 1], np.asarray(data['survival_times'], dtype=np.float64))
+            self._axes[1, 1].set_title(f"Survival Times (Gen {current_gen})")
 
-                sns.histplot(filtered, ax=axes[0, 2], discrete=True, color='darkorange')
-                axes[0, 2].set_xlabel("Checkpoint")
-                axes[0, 2].set_ylabel("Count")
-                axes[0, 2].xaxis.set_major_locator(plt.MaxNLocator(integer=True))
+        # Death position heatmap.
+        if self._death_count > 1:
+            self._heatmap_mesh.set_array(self._heatmap.T)
+            self._heatmap_mesh.set_clim(0, self._heatmap.max())
+            self._heatmap_mesh.set_visible(True)
 
-            axes[0, 2].set_title(f"Checkpoints Reached (Gen {current_gen}, Lap 0)")
+        self.fig.canvas.draw_idle()
+        self.fig.canvas.flush_events()
 
-        # Laps completed (current generation).
-        if 'laps' in data:
-            laps = data['laps']
+    def _set_histogram(self, ax: Axes, values: NDArray[np.float64]) -> None:
+
+        """
+        Shows the distribution of continuous values, with a density curve over it.
+
+        Parameters
+        ----------
+        ax : Axes
+            The axes of the histogram.
+        values : NDArray[float]
+            The values to count.
+        """
+
+        if len(values) == 0:
+            return
+
+        counts, edges = np.histogram(values, bins=_HISTOGRAM_BINS)
+        self._set_bars(ax, edges[:-1], np.diff(edges), counts)
+
+        # Scales the density to the counts, so the curve follows the bars.
+        kde_line: Line2D = self._kde_lines[ax]
+        kde_x, kde_y = _kde(values, edges[0], edges[-1])
+        kde_line.set_data(kde_x, kde_y * len(values) * (edges[1] - edges[0]))
 
-            # If everyone has 0 laps, shows a blank message.
-            if len(laps) == 0 or all(lp == 0 for lp in laps):
+        _rescale(ax)
 
-                _draw_empty_message(axes[1, 0], "No car has completed a lap.")
+    def _set_discrete_histogram(self, ax: Axes, values: NDArray[np.int64]) -> None:
 
+        """
+        Shows how many times each whole number appears, or a message if none is above zero.
+
+        Parameters
+        ----------
+        ax : Axes
+            The axes of the histogram.
+        values : NDArray[int]
+            The values to count.
+        """
+
+        message: Text = self._messages[ax]
+        empty: bool = len(values) == 0 or not values.any()
+
+        # Hides the ticks behind the message, restoring them once there is something to count.
+        if empty != message.get_visible():
+
+            message.set_visible(empty)
+
+            if empty:
+                ax.set_xticks([])
+                ax.set_yticks([])
             else:
+                ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+                ax.yaxis.set_major_locator(AutoLocator())
 
-                sns.histplot(laps, ax=axes[1, 0], discrete=True, color='teal')
-                axes[1, 0].set_xlabel("Laps")
-                axes[1, 0].set_ylabel("Count")
-                axes[1, 0].xaxis.set_major_locator(plt.MaxNLocator(integer=True))
+        if empty:
 
-            axes[1, 0].set_title(f"Laps Completed (Gen {current_gen})")
+            if ax in self._bars:
+                self._bars.pop(ax).remove()
 
-        # Survival times (current generation).
-        if 'survival_times' in data:
+            return
 
-            sns.histplot(data['survival_times'], ax=axes[1, 1], kde=True, color='coral')
-            axes[1, 1].set_title(f"Survival Times (Gen {current_gen})")
-            axes[1, 1].set_xlabel("Time (s)")
-            axes[1, 1].set_ylabel("Count")
+        # Centres a bar on each number from the smallest to the largest.
+        low: int = int(values.min())
+        counts: NDArray[np.int64] = np.bincount(values - low)
+        lefts: NDArray[np.float64] = np.arange(low, low + len(counts)) - 0.5
 
-        # Death position heatmap with track overlay.
-        heatmap_ax = axes[1, 2]
-        is_heatmap_zoomed = (zoomed_ax is heatmap_ax)
+        self._set_bars(ax, lefts, np.ones(len(counts)), counts)
+        _rescale(ax)
 
-        if track_img is not None:
+    def _set_bars(
+        self,
+        ax: Axes,
+        lefts: NDArray[np.float64],
+        widths: NDArray[np.float64],
+        heights: NDArray[np.int64]
+    ) -> None:
 
-            track_height, track_width = track_img.shape[:2]
+        """
+        Moves and resizes the bars of a histogram, only creating new ones when their number changes.
 
-            # Use 'auto' aspect when zoomed to allow proper scaling.
-            aspect: str = 'auto' if is_heatmap_zoomed else 'equal'
-            heatmap_ax.imshow(track_img, extent=[0, track_width, track_height, 0], aspect=aspect)
+        Parameters
+        ----------
+        ax : Axes
+            The axes of the histogram.
+        lefts : NDArray[float]
+            The left edge of each bar.
+        widths : NDArray[float]
+            The width of each bar.
+        heights : NDArray[int]
+            The height of each bar.
+        """
 
-            if 'death_positions' in data and len(data['death_positions']) > 1:
+        bars: BarContainer | None = self._bars.get(ax)
 
-                death_x: list[float] = [pos[0] for pos in data['death_positions']]
-                death_y: list[float] = [pos[1] for pos in data['death_positions']]
+        if bars is None or len(bars) != len(heights):
 
-                bin_size: int = 20
-                bins_x: int = int(track_width / bin_size)
-                bins_y: int = int(track_height / bin_size)
+            if bars is not None:
+                bars.remove()
 
-                _, _, _, mesh = heatmap_ax.hist2d(
-                    death_x, death_y,
-                    bins=[bins_x, bins_y],
-                    cmap='Reds',
-                    alpha=0.4,
-                    range=[[0, track_width], [0, track_height]]
-                )
+            self._bars[ax] = ax.bar(
+                lefts, heights, width=widths, align='edge',
+                color=self._colours[ax], alpha=0.75, edgecolor='#1a1a1a'
+            )
 
-                # Only shows the colour bar if not zoomed into a different plot.
-                if zoomed_ax is None or is_heatmap_zoomed:
-                    heatmap_cbar = fig.colorbar(mesh, ax=heatmap_ax)
-                    heatmap_cbar.set_label('Deaths')
+            return
 
-            heatmap_ax.set_xlim(0, track_width)
-            heatmap_ax.set_ylim(track_height, 0)
-            heatmap_ax.grid(alpha=0.1)
+        for bar, left, width, height in zip(bars, lefts, widths, heights):
+            bar.set_x(left)
+            bar.set_width(width)
+            bar.set_height(height)
 
-        heatmap_ax.set_title("Death Heatmap (All Generations)")
-        heatmap_ax.set_xlabel("X")
-        heatmap_ax.set_ylabel("Y")
+    def _on_click(self, event: Event) -> None:
+
+        """
+        Zooms into the clicked subplot, or restores the grid view if already zoomed.
 
-        if zoomed_ax is None:
+        Parameters
+        ----------
+        event : Event
+            The matplotlib click event.
+        """
 
-            fig.tight_layout()
+        if not isinstance(event, MouseEvent):
+            return None
 
-        else:
+        if event.inaxes is None:
+            return None
 
-            for ax in axes.flat:
+        heatmap_ax: Axes = self._axes[1, 2]
+        cbar_ax: Axes = self._heatmap_cbar.ax
 
-                if ax != zoomed_ax:
+        # If the view is already zoomed, restores the grid view.
+        if self._zoomed_ax is not None:
+
+            for ax, position in self._original_positions.items():
+                ax.set_visible(True)
+                ax.set_position(position)
+
+            heatmap_ax.set_aspect('equal')
+            self._zoomed_ax = None
+            self.fig.canvas.draw_idle()
+            return None
+
+        # Zooms into clicked subplot.
+        clicked_ax: Axes = event.inaxes
+        if clicked_ax in self._axes.flat:
+
+            for ax in self._axes.flat:
+                if ax != clicked_ax:
                     ax.set_visible(False)
-                else:
-                    ax.set_position((0.1, 0.1, 0.8, 0.8))
 
-            # Positions the colour bar when the heatmap is zoomed.
-            if is_heatmap_zoomed and heatmap_cbar is not None:
-                heatmap_cbar.ax.set_visible(True)
-                heatmap_cbar.ax.set_position((0.87, 0.1, 0.03, 0.8))
-            elif heatmap_cbar is not None:
-                heatmap_cbar.ax.set_visible(False)
+            clicked_ax.set_position(_ZOOMED_POSITION)
+            self._zoomed_ax = clicked_ax
+
+            # Uses 'auto' aspect when the heatmap is zoomed, to allow proper scaling, and keeps its colour bar.
+            if clicked_ax is heatmap_ax:
+                heatmap_ax.set_aspect('auto')
+                cbar_ax.set_position(_ZOOMED_COLOUR_BAR_POSITION)
+            else:
+                cbar_ax.set_visible(False)
+
+            self.fig.canvas.draw_idle()
 
-        fig.canvas.draw_idle()
-        fig.canvas.flush_events()
+        return None
 
 
-def _draw_empty_message(ax: Axes, message: str) -> None:
+def _rescale(ax: Axes) -> None:
 
     """
-    Draws a message when there is no relevant data.
+    Fits the view of the given axes to its artists' current data.
 
     Parameters
     ----------
     ax : Axes
-        The axes on which to draw the message.
-    message : str
-        The message to draw.
+        The axes to rescale.
     """
 
-    ax.clear()
-    ax.set_xticks([])
-    ax.set_yticks([])
-    ax.text(
-        0.5, 0.5, message,
-        ha="center", va="center", fontsize=12, color="white",
-        transform=ax.transAxes
-    )
+    ax.relim()
+    ax.autoscale_view()
+
+
+def _count_uniform(
+    positions: NDArray[np.float32],
+    size: NDArray[np.float64],
+    bins: NDArray[np.int64]
+) -> NDArray[np.int64]:
+
+    """
+    Counts how many positions fall in each cell of a uniform grid.
+
+    Parameters
+    ----------
+    positions : NDArray[float]
+        The positions to count, with shape ``(N, 2)``.
+    size : NDArray[float]
+        The width and height the grid covers, starting from the origin.
+    bins : NDArray[int]
+        The number of columns and rows of the grid.
+
+    Returns
+    -------
+    NDArray[int]
+        The count of each cell, with shape ``(columns, rows)``.
+
+    Notes
+    -----
+    Matches ``np.histogram2d()`` over the same range, but finds each cell
+    directly instead of searching for it among the bin edges.
+    """
+
+    # Skips positions outside the grid, keeping those on its far edges in the last cells.
+    inside: NDArray[np.bool_] = ((positions >= 0) & (positions <= size)).all(axis=1)
+    cells: NDArray[np.int64] = np.minimum((positions[inside] * (bins / size)).astype(np.int64), bins - 1)
+
+    return np.bincount(cells[:, 0] * bins[1] + cells[:, 1], minlength=bins[0] * bins[1]).reshape(bins)
+
+
+def _kde(values: NDArray[np.float64], low: float, high: float) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+
+    """
+    Estimates the density of the given values with a Gaussian kernel.
+
+    Parameters
+    ----------
+    values : NDArray[float]
+        The values to estimate the density of.
+    low : float
+        Where the curve starts.
+    high : float
+        Where the curve ends.
+
+    Returns
+    -------
+    tuple[NDArray[float], NDArray[float]]
+        The points the density was sampled at, and the density at each one.
+        Both are empty if the values are all the same.
+
+    Notes
+    -----
+    Uses Scott's rule for the bandwidth, as seaborn does by default.
+    """
+
+    std: float = float(values.std(ddof=1)) if len(values) > 1 else 0.0
+
+    if std == 0.0:
+        return np.empty(0), np.empty(0)
+
+    bandwidth: float = std * len(values) ** -0.2
+    xs: NDArray[np.float64] = np.linspace(low, high, _KDE_POINTS)
+    offsets: NDArray[np.float64] = (xs[:, None] - values[None, :]) / bandwidth
+    density: NDArray[np.float64] = np.exp(-0.5 * offsets ** 2).sum(axis=1)
+
+    return xs, density / (len(values) * bandwidth * np.sqrt(2 * np.pi))
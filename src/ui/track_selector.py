@@ -1,14 +1,21 @@
+import os
 import pygame
 
 from config import COLOURS, FONTS, GAME
 from pathlib import Path
-from pygame import Surface
+from pygame import Rect, Surface
 from pygame.time import Clock
-from src.core.utils import draw_outlined_text
+from src.core.utils import draw_outlined_text, get_pending_events, init_pygame, set_system_cursor
 from .button import Button
 from .list_item import ListItem
 
 
+# The events the track selector responds to.
+_EVENTS: tuple[int, ...] = (
+    pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEWHEEL, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED
+)
+
+
 class TrackSelector:
 
     """
@@ -22,30 +29,62 @@ class TrackSelector:
 
     def __init__(self, tracks_directory: str = './data/tracks/raw') -> None:
 
-        pygame.init()
+        init_pygame()
 
         self._screen: Surface = pygame.display.set_mode((GAME.SCREEN_WIDTH, GAME.SCREEN_HEIGHT))
         self._clock: Clock = Clock()
         self._running: bool = True
+        self._dirty: bool = True
         self._selected_track: str | None = None
-        self._track_items: list[ListItem] = []
+        self._selected_name: str = ""
+
+        # The parts of the screen drawn this frame that can change, so only they are sent to the display.
+        self._dirty_rects: list[Rect] = []
+        self._full_update: bool = True
+        self._status_rect: Rect = Rect(0, 0, 0, 0)
 
         pygame.display.set_caption("NEAT-ish Racing - Select Track")
 
         # Resets the cursor.
-        pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        set_system_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
         # Loads available track files.
         self._tracks_directory: Path = Path(tracks_directory)
         self._available_tracks: list[str] = self._load_available_tracks()
 
+        # The name shown for each track, worked out once rather than on every scroll.
+        self._track_names: list[str] = [Path(path).stem for path in self._available_tracks]
+
         # Scrolling state.
         self._scroll_offset: int = 0
-        self._last_scroll_offset: int = 0
         self._max_visible_items: int = 8
         self._item_height: int = 40
         self._list_start_y: int = 180
 
+        # The area covered by the list and its scroll indicators.
+        self._list_rect: Rect = Rect(
+            GAME.SCREEN_WIDTH // 2 - 300,
+            self._list_start_y - 40,
+            600,
+            self._max_visible_items * self._item_height + 80
+        )
+
+        # Creates one list item per visible row, which are reused as the list scrolls.
+        item_width: int = 600
+        item_position: int = GAME.SCREEN_WIDTH // 2 - item_width // 2
+
+        self._track_items: list[ListItem] = [
+            ListItem(item_position, self._list_start_y + (i * self._item_height), item_width, self._item_height - 4, "")
+            for i in range(min(self._max_visible_items, len(self._available_tracks)))
+        ]
+        self._refresh_track_items()
+
+        # The list item under the mouse, if any.
+        self._hovered_item: ListItem | None = None
+
+        # Everything that never changes, drawn once rather than every frame.
+        self._background: Surface = self._render_background()
+
         # Creates the start button.
         self._start_button: Button = Button(
             x=GAME.SCREEN_WIDTH // 2 - 75,
@@ -79,10 +118,16 @@ class TrackSelector:
         if not self._tracks_directory.exists():
             return []
 
-        track_files: list[Path] = list(self._tracks_directory.glob('*.tmx'))
-        track_files.sort(key=lambda p: p.name)
+        # Lists the directory once, without building a Path for each file.
+        with os.scandir(self._tracks_directory) as entries:
+            track_files: list[tuple[str, str]] = [
+                (entry.name, entry.path) for entry in entries
+                if entry.name.endswith('.tmx') and entry.is_file()
+            ]
 
-        return [str(path) for path in track_files]
+        track_files.sort()
+
+        return [path for _, path in track_files]
 
     def run(self) -> str | None:
 
@@ -95,23 +140,49 @@ class TrackSelector:
             The selected track path, or None if cancelled.
         """
 
-        while self._running:
+        # Has SDL drop every event the screen ignores, instead of queueing it.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_EVENTS)
+
+        try:
+
+            event: pygame.event.Event = pygame.event.Event(pygame.NOEVENT)
+
+            while self._running:
+
+                result: str | None = self._process_events(event)
+
+                if result is not None:
+                    return result
 
-            result: str | None = self._process_events()
+                # Only redraws the screen when an event changed it.
+                if self._dirty:
+                    self._draw()
+                    self._dirty = False
 
-            if result is not None:
-                return result
+                self._clock.tick(GAME.FPS)
 
-            self._draw()
-            self._clock.tick(GAME.FPS)
+                # Sleeps until the next event arrives, as the screen only changes in response to one.
+                event = pygame.event.wait(GAME.IDLE_TIMEOUT)
+
+        finally:
+
+            # Lets every event through again for the next screen.
+            pygame.event.set_allowed(None)
 
         return None
 
-    def _process_events(self) -> str | None:
+    def _process_events(self, first: pygame.event.Event) -> str | None:
 
         """
         Processes all pending Pygame events.
 
+        Parameters
+        ----------
+        first : pygame.event.Event
+            The event the screen woke up for, which comes before the pending
+            ones, or a ``NOEVENT`` if it woke up without one.
+
         Returns
         -------
         str | None
@@ -119,12 +190,21 @@ class TrackSelector:
             'QUIT' to quit.
         """
 
-        # Only updates items if the scroll state changed or items don't exist yet.
-        if self._scroll_offset != self._last_scroll_offset or not self._track_items:
-            self._update_track_items()
-            self._last_scroll_offset = self._scroll_offset
+        widgets: list[Button | ListItem] = [
+            self._back_button, self._start_button, *self._track_items
+        ]
+        hovered: list[bool] = [widget.is_hovered for widget in widgets]
+
+        events: list[pygame.event.Event] = get_pending_events(first)
 
-        for event in pygame.event.get():
+        # Adds up the scrolling of every wheel event, so the list is only scrolled once.
+        wheel_delta: int = 0
+
+        for event in events:
+
+            # Mouse motion only changes the screen if it changes what is hovered.
+            if event.type != pygame.MOUSEMOTION:
+                self._dirty = True
 
             if event.type == pygame.QUIT:
                 return 'QUIT'
@@ -134,7 +214,10 @@ class TrackSelector:
                     self._running = False
 
             elif event.type == pygame.MOUSEWHEEL:
-                self._handle_scroll(event.y)
+                wheel_delta += event.y
+
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._full_update = True
 
             if self._back_button.handle_event(event):
                 self._running = False
@@ -144,20 +227,72 @@ class TrackSelector:
                     return self._selected_track
 
             # Handles list items events.
-            for item in self._track_items:
+            clicked_item: ListItem | None = self._handle_item_event(event)
 
-                if item.handle_event(event):
+            if clicked_item is not None:
 
-                    self._selected_track = item.data
+                self._selected_track = clicked_item.data
+                self._selected_name = clicked_item.text
 
-                    # Updates selection state for all items.
-                    for it in self._track_items:
-                        it.is_selected = (it.data == self._selected_track)
+                # Updates selection state for all items.
+                for item in self._track_items:
+                    item.is_selected = (item.data == self._selected_track)
 
-                    break
+        if wheel_delta:
+            self._handle_scroll(wheel_delta)
+
+        # Redraws the screen if the mouse moved onto or off a button or item.
+        if [widget.is_hovered for widget in widgets] != hovered:
+            self._dirty = True
 
         return None
 
+    def _handle_item_event(self, event: pygame.event.Event) -> ListItem | None:
+
+        """
+        Passes a mouse event to the list items it can affect.
+
+        Parameters
+        ----------
+        event : pygame.event.Event
+            The pygame event to handle.
+
+        Returns
+        -------
+        ListItem | None
+            The item that was clicked, or ``None`` if no item was.
+
+        Notes
+        -----
+        Only the item in the row under the mouse, and the item the mouse
+        was last over, can respond, so the others are skipped.
+        """
+
+        if event.type not in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+            return None
+
+        # Finds the row under the mouse from its height, rather than testing every item.
+        row: int = (event.pos[1] - self._list_start_y) // self._item_height
+        row_item: ListItem | None = self._track_items[row] if 0 <= row < len(self._track_items) else None
+
+        clicked_item: ListItem | None = None
+
+        for item in (self._hovered_item, row_item):
+
+            if item is not None and item.handle_event(event):
+                clicked_item = item
+
+            # Stops early if the mouse is still over the same item.
+            if row_item is self._hovered_item:
+                break
+
+        if row_item is not None and row_item.is_hovered:
+            self._hovered_item = row_item
+        else:
+            self._hovered_item = None
+
+        return clicked_item
+
     def _handle_scroll(self, direction: int) -> None:
 
         """
@@ -170,33 +305,70 @@ class TrackSelector:
         """
 
         max_scroll: int = max(0, len(self._available_tracks) - self._max_visible_items)
-        self._scroll_offset = max(0, min(max_scroll, self._scroll_offset - direction))
+        scroll_offset: int = max(0, min(max_scroll, self._scroll_offset - direction))
 
-    def _draw(self) -> None:
+        # Only refreshes items if the list actually scrolled.
+        if scroll_offset != self._scroll_offset:
+
+            self._scroll_offset = scroll_offset
+            self._refresh_track_items()
+            self._dirty = True
+
+    def _render_background(self) -> Surface:
 
         """
-        Draws the track selector screen.
+        Renders the parts of the track selector screen that never change.
+
+        Returns
+        -------
+        Surface
+            The static part of the screen, the same size as the screen.
         """
 
-        # Background.
-        self._screen.fill(COLOURS.BACKGROUND)
+        background: Surface = Surface((GAME.SCREEN_WIDTH, GAME.SCREEN_HEIGHT)).convert()
+        background.fill(COLOURS.BACKGROUND)
 
         # Title.
         draw_outlined_text(
-            self._screen,
+            background,
             "Select Track",
             (GAME.SCREEN_WIDTH // 2, 80),
             font_size=FONTS.SIZE_LARGE
         )
 
+        # Instructions.
+        draw_outlined_text(
+            background,
+            "Click to select a track. Scroll to see more.",
+            (GAME.SCREEN_WIDTH // 2, 580),
+            font_size=FONTS.SIZE_NORMAL,
+            text_colour=COLOURS.TEXT_SECONDARY
+        )
+
+        return background
+
+    def _draw(self) -> None:
+
+        """
+        Draws the track selector screen.
+        """
+
+        self._dirty_rects.clear()
+
+        # Draws the whole background the first time, and only the parts that can change afterwards.
+        if self._full_update:
+            self._screen.blit(self._background, (0, 0))
+        else:
+            for rect in (self._status_rect, self._list_rect, self._back_button.rect, self._start_button.rect):
+                self._screen.blit(self._background, rect, rect)
+
         # Selected track display.
         if self._selected_track:
-            track_name = Path(self._selected_track).stem
-            display_text = f"Selected: {track_name}"
+            display_text = f"Selected: {self._selected_name}"
         else:
             display_text = "No track selected"
 
-        draw_outlined_text(
+        status_rect: Rect = draw_outlined_text(
             self._screen,
             display_text,
             (GAME.SCREEN_WIDTH // 2, 110),
@@ -204,62 +376,44 @@ class TrackSelector:
             text_colour=COLOURS.TEXT_SECONDARY
         )
 
+        # Updates the text's whole row, so shorter text covers longer text drawn before it.
+        self._status_rect = Rect(0, status_rect.y, GAME.SCREEN_WIDTH, status_rect.height)
+        self._dirty_rects.append(self._status_rect)
+
         # Draws the track list.
         self._draw_track_list()
 
         # Draws scroll indicators if needed.
         self._draw_scroll_indicators()
+        self._dirty_rects.append(self._list_rect)
 
         # Draws buttons.
-        self._back_button.draw(self._screen)
+        self._dirty_rects.append(self._back_button.draw(self._screen))
 
         # Only enables the start button if a track is selected.
         self._start_button.disabled = not self._selected_track
-        self._start_button.draw(self._screen)
+        self._dirty_rects.append(self._start_button.draw(self._screen))
 
-        # Instructions.
-        draw_outlined_text(
-            self._screen,
-            "Click to select a track. Scroll to see more.",
-            (GAME.SCREEN_WIDTH // 2, 580),
-            font_size=FONTS.SIZE_NORMAL,
-            text_colour=COLOURS.TEXT_SECONDARY
-        )
-
-        pygame.display.flip()
+        # Updates the whole screen the first time, and only the parts that can change afterwards.
+        if self._full_update:
+            pygame.display.flip()
+            self._full_update = False
+        else:
+            pygame.display.update(self._dirty_rects)
 
-    def _update_track_items(self) -> None:
+    def _refresh_track_items(self) -> None:
 
         """
-        Updates the list items based on current scroll position.
+        Shows the tracks at the current scroll position in the list items.
         """
 
-        # Hides items if overflowing.
-        self._track_items.clear()
-        visible_start: int = self._scroll_offset
-        visible_end: int = min(visible_start + self._max_visible_items, len(self._available_tracks))
-
-        item_width: int = 600
-        item_position: int = GAME.SCREEN_WIDTH // 2 - item_width // 2
+        for i, item in enumerate(self._track_items):
 
-        # Creates a ListItem for each item of the list.
-        for i, track_index in enumerate(range(visible_start, visible_end)):
-
-            track_path: str = self._available_tracks[track_index]
-            track_name: str = Path(track_path).stem
-            y: int = self._list_start_y + (i * self._item_height)
-
-            item: ListItem = ListItem(
-                item_position,
-                y,
-                item_width,
-                self._item_height - 4,
-                track_name,
-                data=track_path
-            )
+            track_path: str = self._available_tracks[self._scroll_offset + i]
 
+            item.text = self._track_names[self._scroll_offset + i]
+            item.data = track_path
             item.is_selected = (track_path == self._selected_track)
-            self._track_items.append(item)
 
     def _draw_track_list(self) -> None:
 
@@ -278,9 +432,13 @@ class TrackSelector:
             )
             return
 
-        # Draws all items.
+        item_blits: list[tuple[Surface, tuple[int, int]]] = []
+
         for item in self._track_items:
-            item.draw(self._screen)
+            item_blits.extend(item.get_blits())
+
+        # Draws every item in a single call.
+        self._screen.blits(item_blits, doreturn=False)
 
     def _draw_scroll_indicators(self) -> None:
 